@@ -21,6 +21,15 @@ class AMSHub:
     def __setitem__(self, ind: int, item: "AMS"):
         self.ams_hub[ind] = item
 
+    def items(self):
+        """
+        Iterate over the AMS units without probing each index.
+
+        Returns:
+            ItemsView[int, AMS]: (ams index, AMS unit) pairs
+        """
+        return self.ams_hub.items()
+
 
 class AMS:
     """
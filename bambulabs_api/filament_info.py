@@ -143,9 +143,9 @@ class Filament(AMSFilamentSettings, Enum):
     @classmethod
     def _missing_(cls, value: Any):
         if isinstance(value, str):
-            for filament in cls:
-                if value == filament.name:
-                    return filament
+            filament = cls.__members__.get(value)
+            if filament is not None:
+                return filament
 
         raise ValueError(f"Filament {value} not found")
 
@@ -3,7 +3,8 @@ __all__ = ["PrinterMQTTClient"]
 import json
 import logging
 import ssl
-import datetime
+import time
+import threading
 from typing import Any, Callable, Union
 from re import match
 
@@ -127,6 +128,7 @@ class PrinterMQTTClient:
         self.command_topic = f"device/{printer_serial}/request"
         logging.info(f"{self.command_topic}")   # noqa: E501  # pylint: disable=logging-fstring-interpolation
         self._data: dict[Any, Any] = {}
+        self._ready_event = threading.Event()
 
         self.ams_hub: AMSHub = AMSHub()
         self.strict = strict
@@ -164,6 +166,19 @@ class PrinterMQTTClient:
     def ready(self) -> bool:
         return bool(self._data)
 
+    def wait_until_ready(self, timeout: float | None = None) -> bool:
+        """
+        Block until the first printer report has been received.
+
+        Args:
+            timeout (float | None): seconds to wait, or None to wait
+                indefinitely
+
+        Returns:
+            bool: True if the client is ready, False if the wait timed out
+        """
+        return self._ready_event.wait(timeout)
+
     def _on_disconnect(
         self,
         client: mqtt.Client,
@@ -201,6 +216,9 @@ class PrinterMQTTClient:
             self._data[k] |= v
         logging.debug(self._data)
 
+        if self._data:
+            self._ready_event.set()
+
         firmware_version = self.firmware_version()
         if firmware_version is not None:
             self.printer_info.firmware_version = firmware_version
@@ -292,6 +310,18 @@ class PrinterMQTTClient:
         """
         return self._data
 
+    @__ready
+    def print_snapshot(self) -> dict[str, Any]:
+        """
+        Get a shallow copy of the latest print report, so several fields can
+        be read from one consistent view instead of one getter call each.
+
+        Returns:
+            dict[str, Any]: copy of the "print" section of the latest data
+        """
+        self._update()
+        return dict(self._data.get("print", {}))
+
     @__ready
     def __get_print(self, key: str, default: Any = None) -> Any:
         self._update()
@@ -302,7 +332,7 @@ class PrinterMQTTClient:
         return self._data.get("info", {}).get(key, default)
 
     def _update(self) -> bool:
-        current_time = int(datetime.datetime.now().timestamp())
+        current_time = int(time.time())
         if self._last_update + self.pushall_timeout > current_time:
             return False
         self._last_update = current_time
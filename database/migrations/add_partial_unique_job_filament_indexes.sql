@@ -0,0 +1,27 @@
+-- Partial Unique Indexes for Job Filaments
+-- UNIQUE(job_history_id, ams_id, tray_id) never matches external spool rows because
+-- PostgreSQL treats NULLs as distinct, so those rows could be inserted twice per job.
+-- Replace it with one partial unique index per row kind; the monitor's upserts name
+-- these indexes as their ON CONFLICT targets.
+
+-- Remove duplicate external spool rows left behind by the old constraint
+DELETE FROM printer_job_filaments a
+USING printer_job_filaments b
+WHERE a.ams_id IS NULL AND b.ams_id IS NULL
+  AND a.job_history_id = b.job_history_id
+  AND a.ctid > b.ctid;
+
+-- One row per AMS tray position
+CREATE UNIQUE INDEX IF NOT EXISTS uq_job_filaments_ams_tray
+    ON printer_job_filaments(job_history_id, ams_id, tray_id)
+    WHERE ams_id IS NOT NULL;
+
+-- One external spool row per job
+CREATE UNIQUE INDEX IF NOT EXISTS uq_job_filaments_external
+    ON printer_job_filaments(job_history_id)
+    WHERE ams_id IS NULL;
+
+ALTER TABLE printer_job_filaments DROP CONSTRAINT IF EXISTS unique_job_ams_tray;
+
+-- If an expression index on (job_history_id, COALESCE(ams_id, -1), COALESCE(tray_id, -1))
+-- was created by hand for older monitor versions, it can be dropped after this migration.
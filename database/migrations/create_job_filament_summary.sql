@@ -0,0 +1,18 @@
+-- Job Filament Summary
+-- Per-job filament aggregates for reports, so they don't re-aggregate printer_job_filaments
+-- on every query. The monitor refreshes it after each job end when JOB_FILAMENT_SUMMARY=1.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS job_filament_summary AS
+SELECT job_history_id,
+       COUNT(*) AS filament_count,
+       COUNT(*) FILTER (WHERE was_used) AS used_count,
+       array_agg(DISTINCT filament_type) FILTER (WHERE filament_type IS NOT NULL) AS types
+FROM printer_job_filaments
+GROUP BY job_history_id;
+
+-- Required by REFRESH MATERIALIZED VIEW CONCURRENTLY, which keeps the view readable while refreshing
+CREATE UNIQUE INDEX IF NOT EXISTS uq_job_filament_summary_job
+    ON job_filament_summary(job_history_id);
+
+COMMENT ON MATERIALIZED VIEW job_filament_summary IS
+'Per-job filament counts and types. Refreshed by the printer monitor after each job end; run REFRESH MATERIALIZED VIEW CONCURRENTLY job_filament_summary to update it by hand.';
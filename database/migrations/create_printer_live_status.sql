@@ -0,0 +1,27 @@
+-- Live Printer Status Table
+-- Moves the fields the monitor rewrites on every poll out of the printers table into an
+-- UNLOGGED companion table: no WAL writes and no autovacuum churn on printer configuration.
+-- Unlogged tables are emptied after a crash; the monitor repopulates it on its next cycle.
+-- Enable in the monitor with PRINTER_LIVE_STATUS=1 once this migration has been applied.
+
+CREATE UNLOGGED TABLE IF NOT EXISTS printer_live_status (
+    printer_id INTEGER PRIMARY KEY REFERENCES printers(printer_id) ON DELETE CASCADE,
+    last_poll_status TEXT,
+    last_polled_at TIMESTAMP,
+    remaining_time INTEGER,
+    current_print_job TEXT,
+    print_progress NUMERIC
+);
+
+-- Readers that expect the status columns alongside printer configuration
+CREATE OR REPLACE VIEW printers_with_live_status AS
+SELECT p.printer_id, p.printer_name, p.in_production,
+       s.last_poll_status, s.last_polled_at, s.remaining_time, s.current_print_job, s.print_progress
+FROM printers p
+LEFT JOIN printer_live_status s ON s.printer_id = p.printer_id;
+
+-- Add comments
+COMMENT ON TABLE printer_live_status IS
+'Latest polled status per printer, written by the monitor every cycle. UNLOGGED: contents are not crash-safe and are rebuilt from the next poll.';
+COMMENT ON COLUMN printer_live_status.remaining_time IS 'Estimated remaining print time in seconds';
+COMMENT ON COLUMN printer_live_status.print_progress IS 'Print progress percentage (0-100)';
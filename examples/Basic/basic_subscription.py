@@ -2,6 +2,7 @@ import time
 import bambulabs_api as bl
 import os
 import datetime
+import json
 
 IP = '192.168.1.200'
 SERIAL = 'AC12309BH109'
@@ -53,7 +54,6 @@ if __name__ == '__main__':
             )
 
             if debug:
-                import json
                 print("=" * 100)
                 print("Printer MQTT Dump")
                 print(json.dumps(
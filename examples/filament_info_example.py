@@ -5,6 +5,7 @@ This shows how to get both the currently active filament and all AMS filament in
 """
 
 import os
+import re
 import sys
 import bambulabs_api as bl
 from dotenv import load_dotenv
@@ -14,6 +15,60 @@ from rich.table import Table
 # Load environment variables
 load_dotenv()
 
+# Matches RRGGBBFF colors so the opaque alpha suffix can be dropped for display
+COLOR_RE = re.compile(r'^([0-9A-Fa-f]{6})FF$')
+
+# Values the printer reports for unset tray fields
+BAD_VALUES = frozenset({'N/A', ''})
+BAD_COLORS = BAD_VALUES | {'00000000'}
+BAD_WEIGHTS = BAD_VALUES | {'0'}
+BAD_TEMPS = BAD_VALUES | {0}
+
+# Shown in place of an unset value
+NA = "[dim]N/A[/]"
+
+
+def strip_alpha(color):
+    """Remove the FF alpha suffix from a tray color, leaving other values as-is."""
+    m = COLOR_RE.match(color or '')
+    return m.group(1) if m else color
+
+
+def format_temp_range(low, high):
+    """Format a nozzle temperature range, collapsing missing or equal bounds; None if both unset."""
+    low = None if low in BAD_TEMPS else low
+    high = None if high in BAD_TEMPS else high
+    if low is None or high is None:
+        single = low if low is not None else high
+        return f"{single}°C" if single is not None else None
+    return f"{low}°C" if low == high else f"{low}-{high}°C"
+
+
+def filament_rows(tray):
+    """Build the (property, value) display rows for a filament tray."""
+    display_color = strip_alpha(tray.tray_color)
+    brand, weight, bed_temp = tray.tray_sub_brands, tray.tray_weight, tray.bed_temp
+    return [
+        ("Type", f"[magenta]{tray.tray_type}[/]"),
+        ("Color", f"[yellow]{display_color}[/]" if display_color not in BAD_COLORS else NA),
+        ("Brand", brand if brand not in BAD_VALUES else NA),
+        ("Weight", f"{weight}g" if weight not in BAD_WEIGHTS else NA),
+        ("Temp Range", format_temp_range(tray.nozzle_temp_min, tray.nozzle_temp_max) or NA),
+        ("Bed Temp", f"{bed_temp}°C" if bed_temp not in BAD_VALUES else NA),
+    ]
+
+
+def build_table(rows, width):
+    """Build a borderless two-column table from (property, value) rows."""
+    table = Table(show_header=False, box=None, padding=(0, 1))
+    table.add_column("Property", style="dim", width=width)
+    table.add_column("Value")
+    add_row = table.add_row
+    for label, value in rows:
+        add_row(label, value)
+    return table
+
+
 def display_filament_info(printer_client, printer_name):
     """Display comprehensive filament information for a printer."""
     console = Console()
@@ -28,24 +83,9 @@ def display_filament_info(printer_client, printer_name):
             console.print(f"\n[bold green]Currently Active Filament:[/]")
             
             # Create table for active filament
-            active_table = Table(show_header=False, box=None, padding=(0, 1))
-            active_table.add_column("Property", style="dim", width=15)
-            active_table.add_column("Value")
-            
-            active_table.add_row("Type", f"[magenta]{vt_tray.tray_type}[/]")
-            # Remove FF suffix from color if present
-            display_color = vt_tray.tray_color
-            if (display_color and display_color not in ['N/A', ''] and
-                len(display_color) == 8 and display_color.endswith('FF')):
-                display_color = display_color[:-2]
-            active_table.add_row("Color", f"[yellow]{display_color}[/]" if display_color != 'N/A' else "[dim]N/A[/]")
-            active_table.add_row("Brand", vt_tray.tray_sub_brands if vt_tray.tray_sub_brands != 'N/A' else "[dim]N/A[/]")
-            active_table.add_row("Weight", f"{vt_tray.tray_weight}g" if vt_tray.tray_weight != 'N/A' else "[dim]N/A[/]")
-            active_table.add_row("Temp Range", f"{vt_tray.nozzle_temp_min}-{vt_tray.nozzle_temp_max}°C")
-            active_table.add_row("Bed Temp", f"{vt_tray.bed_temp}°C" if vt_tray.bed_temp != 'N/A' else "[dim]N/A[/]")
-            active_table.add_row("UUID", vt_tray.tray_uuid if vt_tray.tray_uuid != 'N/A' else "[dim]N/A[/]")
-            
-            console.print(active_table)
+            rows = filament_rows(vt_tray)
+            rows.append(("UUID", vt_tray.tray_uuid if vt_tray.tray_uuid not in BAD_VALUES else NA))
+            console.print(build_table(rows, width=15))
         else:
             console.print("[yellow]No active filament detected[/]")
     except Exception as e:
@@ -76,22 +116,9 @@ def display_filament_info(printer_client, printer_name):
                             tray_found = True
                         
                         # Create table for this tray
-                        tray_table = Table(show_header=False, box=None, padding=(0, 1))
-                        tray_table.add_column("Property", style="dim", width=12)
-                        tray_table.add_column("Value")
-                        
-                        tray_table.add_row("Tray", f"[cyan]{tray_id}[/]")
-                        tray_table.add_row("Type", f"[magenta]{tray.tray_type}[/]")
-                        # Remove FF suffix from color if present
-                        tray_display_color = tray.tray_color
-                        if (tray_display_color and tray_display_color not in ['N/A', ''] and
-                            len(tray_display_color) == 8 and tray_display_color.endswith('FF')):
-                            tray_display_color = tray_display_color[:-2]
-                        tray_table.add_row("Color", f"[yellow]{tray_display_color}[/]" if tray_display_color != 'N/A' else "[dim]N/A[/]")
-                        tray_table.add_row("Brand", tray.tray_sub_brands if tray.tray_sub_brands != 'N/A' else "[dim]N/A[/]")
-                        tray_table.add_row("Weight", f"{tray.tray_weight}g" if tray.tray_weight != 'N/A' else "[dim]N/A[/]")
-                        tray_table.add_row("Temp Range", f"{tray.nozzle_temp_min}-{tray.nozzle_temp_max}°C")
-                        tray_table.add_row("Bed Temp", f"{tray.bed_temp}°C" if tray.bed_temp != 'N/A' else "[dim]N/A[/]")
+                        tray_table = build_table(
+                            [("Tray", f"[cyan]{tray_id}[/]")] + filament_rows(tray), width=12
+                        )
                         
                         console.print(f"    Tray {tray_id}:")
                         console.print(tray_table)
@@ -132,16 +159,9 @@ def main():
         printer.mqtt_start()
         
         # Wait for MQTT to be ready
-        import time
         console.print("Waiting for MQTT client to receive initial data...")
-        start_time = time.time()
-        timeout = 10
-        
-        while time.time() - start_time < timeout:
-            if printer.mqtt_client.ready():
-                console.print("[green]MQTT client is ready![/]")
-                break
-            time.sleep(0.5)
+        if printer.mqtt_client.wait_until_ready(timeout=10):
+            console.print("[green]MQTT client is ready![/]")
         else:
             console.print("[red]Timeout: MQTT client did not become ready[/]")
             return
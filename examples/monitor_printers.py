@@ -3,19 +3,27 @@ import sys
 import time
 import bambulabs_api as bl
 import psycopg2
+import psycopg2.extensions
+import psycopg2.extras
 from psycopg2 import pool
 from dotenv import load_dotenv
-import subprocess
-import platform
+import socket
 import datetime
 import logging
 import logging.handlers  # Add this explicit import
 import json
-from rich.console import Console
+import queue
+import re
+import signal
+from rich.console import Console, Group
+from rich.live import Live
 from rich.table import Table
 from typing import Optional, Dict, List, Tuple
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from contextlib import contextmanager
+from functools import lru_cache
 
 # Load environment variables from .env file
 load_dotenv()
@@ -28,23 +36,221 @@ DB_USER = os.environ.get('DB_USER')
 DB_PASSWORD = os.environ.get('DB_PASSWORD')
 
 # --- Connection Pool Configuration ---
-MIN_CONNECTIONS = 1
-MAX_CONNECTIONS = 5
+MIN_CONNECTIONS = 2
+MAX_CONNECTIONS = int(os.environ.get('DB_POOL_MAX', '16'))  # grown to the printer count in initialize_printers
 CONNECTION_TIMEOUT = 30  # seconds
 RECONNECT_DELAY = 5  # seconds
 MAX_RECONNECT_ATTEMPTS = 3
 
 # --- Printer Connection Configuration ---
 PRINTER_TIMEOUT = 30  # seconds for printer operations
+PRINTER_MQTT_PORT = 8883  # probed before connecting
+PRINTER_PROBE_TIMEOUT = 1  # seconds
 PRINTER_HEALTH_CHECK_INTERVAL = 60  # seconds
+STALE_REPORT_TIMEOUT = 120  # seconds without an MQTT report before a status poll fails
 MAX_CONSECUTIVE_FAILURES = 3  # before moving to unreachable
+MONITOR_INTERVAL = float(os.environ.get('MONITOR_INTERVAL', '10'))  # seconds between cycles unless a printer changes state
+QUIET_PRINTER_REFRESH = 60  # seconds a printer with no new reports may go unprocessed
+MAX_POLL_WORKERS = 32  # upper bound on concurrent printer polls per cycle
+MAX_RETRY_WORKERS = 8  # upper bound on concurrent connection attempts
+# Write per-poll status to the UNLOGGED printer_live_status table
+# (database/migrations/create_printer_live_status.sql) instead of the printers table
+PRINTER_LIVE_STATUS = os.environ.get('PRINTER_LIVE_STATUS') == '1'
+# Refresh the job_filament_summary materialized view after each job end
+# (database/migrations/create_job_filament_summary.sql)
+JOB_FILAMENT_SUMMARY = os.environ.get('JOB_FILAMENT_SUMMARY') == '1'
+
+# ON CONFLICT targets for the external spool upsert: the partial unique index from
+# database/migrations/add_partial_unique_job_filament_indexes.sql, or the COALESCE
+# expression index older databases used, picked at startup by initialize_printers
+EXTERNAL_SPOOL_CONFLICT = "(job_history_id) WHERE ams_id IS NULL"
+LEGACY_EXTERNAL_SPOOL_CONFLICT = "(job_history_id, COALESCE(ams_id, -1), COALESCE(tray_id, -1))"
+
+# --- Filament Profile Cache Configuration ---
+FILAMENT_PROFILE_CACHE_TTL = 300  # seconds; profiles change rarely
+FILAMENT_PROFILE_CACHE_SIZE = 512  # least recently used profiles are evicted beyond this
+
+# --- Display Configuration ---
+_STATUS_COLORS = {"RUNNING": "green", "FINISH": "blue", "FAILED": "red", "IDLE": "yellow"}
+_CYCLE_RULE = f"[dim]{'=' * 50}[/]"
+_PROGRESS_BAR_LENGTH = 20
+_PROGRESS_BARS = tuple('#' * i + '-' * (_PROGRESS_BAR_LENGTH - i) for i in range(_PROGRESS_BAR_LENGTH + 1))
+MONITOR_VERBOSE = os.environ.get('MONITOR_VERBOSE') == '1'  # cycle banners and job-event debug lines
+
+log = logging.getLogger(__name__)
+_NA = "[dim]N/A[/]"
+
+# --- Value Normalization ---
+_COLOR_RE = re.compile(r'^([0-9A-Fa-f]{6})FF$')
+_INVALID_SENTINELS = frozenset({'N/A', '', None})
+_PLACEHOLDER_FILAMENT_IDS = _INVALID_SENTINELS | {'GFL99'}  # GFL99 is often a placeholder
+_INVALID_COLORS = _INVALID_SENTINELS | {'00000000'}  # fully transparent; black 000000 is valid
+_EXTERNAL_SPOOL_TRAYS = frozenset({254, 255})
+
+
+def _as_number(value) -> Optional[float]:
+    """Return value if it is numeric, else None (printers report e.g. "Unknown")."""
+    return value if isinstance(value, (int, float)) else None
+
+
+def _clean_value(value):
+    """Return None for the printer's unset-field sentinels ('N/A', ''), else value."""
+    return None if value in _INVALID_SENTINELS else value
+
+
+def _decode_tray_now(tray_now) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+    """Decode the printer's tray_now into (tray_now_int, ams_id, tray_id).
+
+    tray_now = ams_id * 4 + tray_id for AMS trays (0-15); 254/255 mean external spool,
+    for which ams_id and tray_id are None. All three are None if tray_now is unset.
+    """
+    if tray_now is None:
+        return None, None, None
+    tray_now_int = int(tray_now) if isinstance(tray_now, str) else tray_now
+    if tray_now_int < 16:
+        return tray_now_int, tray_now_int // 4, tray_now_int % 4
+    return tray_now_int, None, None
+
+
+@lru_cache(maxsize=256)
+def _normalize_color(tray_color_raw: Optional[str]) -> Optional[str]:
+    """Strip the opaque alpha suffix from an RRGGBBAA color, None if unset."""
+    if tray_color_raw in _INVALID_SENTINELS:
+        return None
+    m = _COLOR_RE.match(tray_color_raw)
+    return m.group(1) if m else tray_color_raw
+
+
+class QueuedConsole:
+    """Rich Console front-end whose print() calls are written by a background thread.
+
+    Keeps terminal I/O off the polling and processing paths. All instances share
+    one writer thread so output stays in call order; other attributes are
+    forwarded to the wrapped Console.
+    """
+
+    _queue: queue.Queue = queue.Queue()
+    _writer: Optional[threading.Thread] = None
+    _writer_lock = threading.Lock()
+
+    def __init__(self, console: Console):
+        self.console = console
+
+    def print(self, *objects, **kwargs):
+        """Queue a print for the writer thread."""
+        if QueuedConsole._writer is None:
+            with QueuedConsole._writer_lock:
+                if QueuedConsole._writer is None:
+                    QueuedConsole._writer = threading.Thread(
+                        target=QueuedConsole._drain, name="console-writer", daemon=True
+                    )
+                    QueuedConsole._writer.start()
+        QueuedConsole._queue.put((self.console, objects, kwargs))
+
+    @staticmethod
+    def _drain():
+        for console, objects, kwargs in iter(QueuedConsole._queue.get, None):
+            try:
+                console.print(*objects, **kwargs)
+            except Exception as e:
+                logging.error(f"Console write failed: {e}")
+
+    @classmethod
+    def flush(cls):
+        """Write out everything queued so far and stop the writer thread."""
+        with cls._writer_lock:
+            writer, cls._writer = cls._writer, None
+        if writer:
+            cls._queue.put(None)
+            writer.join()
+
+    def __getattr__(self, name):
+        return getattr(self.console, name)
+
+
+# Shared by every manager and the monitor, so all output goes through one terminal state
+CONSOLE = QueuedConsole(Console(legacy_windows=True))
+
+
+def _tray_filament_fields(tray, profiles: Dict[str, Optional[Dict]]) -> Tuple[Optional[str], Optional[str], Tuple]:
+    """Return (filament_id, tray_uuid, columns) for an AMS tray, reading each tray attribute once.
+
+    columns are the printer_job_filaments columns from filament_name to diameter.
+    Database profile values take precedence; the tray's own vendor and diameter are
+    used when the filament has no profile.
+    """
+    tray_info_idx = getattr(tray, 'tray_info_idx', None)
+    db_info = profiles.get(tray_info_idx)
+    if db_info:
+        db_name = db_info.get('db_name')
+        vendor = db_info.get('db_vendor')
+        cost = db_info.get('db_cost')
+        density = db_info.get('db_density')
+        diameter = db_info.get('db_diameter')
+    else:
+        db_name = cost = density = None
+        vendor = _clean_value(getattr(tray, 'tray_sub_brands', None))
+        diameter = _clean_value(getattr(tray, 'tray_diameter', None))
+    return tray_info_idx, getattr(tray, 'tray_uuid', None), (
+        db_name,
+        _clean_value(getattr(tray, 'tray_type', None)),
+        _normalize_color(getattr(tray, 'tray_color', None)),
+        vendor,
+        _clean_value(getattr(tray, 'nozzle_temp_min', None)),
+        _clean_value(getattr(tray, 'nozzle_temp_max', None)),
+        _clean_value(getattr(tray, 'bed_temp', None)),
+        _clean_value(getattr(tray, 'tray_weight', None)),
+        cost,
+        density,
+        diameter,
+    )
+
+
+def _spool_filament_columns(filament_info: Dict) -> Tuple:
+    """Return the printer_job_filaments columns from filament_name to diameter for the external spool.
+
+    filament_info is the dict built by _extract_filament_info; its profile values
+    take precedence over the spool's own vendor and diameter.
+    """
+    get = filament_info.get
+    db_info = get('db_info') or {}
+    if db_info:
+        vendor = db_info.get('db_vendor')
+        diameter = db_info.get('db_diameter')
+    else:
+        vendor = get('brand')
+        diameter = get('diameter')
+    return (
+        db_info.get('db_name'),
+        get('type'),
+        get('color'),
+        vendor,
+        get('temp_min'),
+        get('temp_max'),
+        get('bed_temp'),
+        get('weight'),
+        db_info.get('db_cost'),
+        db_info.get('db_density'),
+        diameter,
+    )
+
+
+class PreparedConnection(psycopg2.extensions.connection):
+    """Connection that remembers which statements have been PREPAREd on it."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared = set()
+
 
 class DatabaseConnectionManager:
     """Manages database connections with automatic reconnection."""
     
-    def __init__(self):
+    def __init__(self, max_connections: int = MAX_CONNECTIONS):
         self.pool = None
-        self.console = Console(legacy_windows=True)
+        self.max_connections = max_connections
+        self.console = CONSOLE
+        self._local = threading.local()  # connection of the open transaction(), per thread
         self._initialize_pool()
     
     def _initialize_pool(self):
@@ -53,13 +259,14 @@ class DatabaseConnectionManager:
             try:
                 self.pool = psycopg2.pool.ThreadedConnectionPool(
                     MIN_CONNECTIONS,
-                    MAX_CONNECTIONS,
+                    self.max_connections,
                     host=DB_HOST,
                     port=DB_PORT,
                     database=DB_NAME,
                     user=DB_USER,
                     password=DB_PASSWORD,
-                    connect_timeout=CONNECTION_TIMEOUT
+                    connect_timeout=CONNECTION_TIMEOUT,
+                    connection_factory=PreparedConnection
                 )
                 self.console.print("[green]Database connection pool initialized.[/]")
                 return
@@ -73,17 +280,25 @@ class DatabaseConnectionManager:
     @contextmanager
     def get_connection(self):
         """Context manager for database connections with automatic cleanup."""
+        shared = getattr(self._local, 'conn', None)
+        if shared is not None:
+            # Inside transaction(): reuse its connection, it commits at the end
+            try:
+                yield shared
+            except Exception:
+                self._local.failed = True
+                raise
+            return
         conn = None
+        broken = False
         try:
             conn = self.pool.getconn()
             yield conn
             conn.commit()
         except psycopg2.OperationalError as e:
             logging.error(f"Database operational error: {e}")
-            if conn:
-                conn.rollback()
-            # Try to reinitialize the pool
-            self._initialize_pool()
+            # Drop just this connection; the pool opens a fresh one on the next getconn
+            broken = True
             raise
         except Exception as e:
             logging.error(f"Database error: {e}")
@@ -92,25 +307,150 @@ class DatabaseConnectionManager:
             raise
         finally:
             if conn:
-                self.pool.putconn(conn)
+                self.pool.putconn(conn, close=broken or bool(conn.closed))
+
+    @contextmanager
+    def transaction(self):
+        """Run the queries issued inside the block on one connection and commit them once.
+
+        If any of them fails the whole block is rolled back and the error re-raised.
+        """
+        if getattr(self._local, 'conn', None) is not None:
+            yield  # already inside a transaction
+            return
+        with self.get_connection() as conn:
+            self._local.conn = conn
+            self._local.failed = False
+            try:
+                yield
+            finally:
+                self._local.conn = None
+            if self._local.failed:
+                raise psycopg2.DatabaseError("a statement in the transaction failed")
+
+    def _in_transaction(self) -> bool:
+        return getattr(self._local, 'conn', None) is not None
     
-    def execute_query(self, query, params=None, fetch=False):
+    def execute_query(self, query, params=None, fetch=False, cursor_factory=None):
         """Execute a query with automatic retry on connection failure."""
         for attempt in range(MAX_RECONNECT_ATTEMPTS):
             try:
                 with self.get_connection() as conn:
-                    with conn.cursor() as cur:
+                    with conn.cursor(cursor_factory=cursor_factory) as cur:
                         cur.execute(query, params)
                         if fetch:
                             return cur.fetchall()
                         return cur.rowcount
             except psycopg2.OperationalError as e:
                 logging.error(f"Query attempt {attempt + 1} failed: {e}")
-                if attempt < MAX_RECONNECT_ATTEMPTS - 1:
+                if attempt < MAX_RECONNECT_ATTEMPTS - 1 and not self._in_transaction():
                     time.sleep(RECONNECT_DELAY)
                 else:
                     raise
     
+    def execute_read(self, query, params=None, cursor_factory=None):
+        """Run a read-only query in autocommit mode, skipping the BEGIN/COMMIT round trips."""
+        if self._in_transaction():
+            return self.execute_query(query, params, fetch=True, cursor_factory=cursor_factory)
+        for attempt in range(MAX_RECONNECT_ATTEMPTS):
+            try:
+                with self.get_connection() as conn:
+                    conn.autocommit = True
+                    try:
+                        with conn.cursor(cursor_factory=cursor_factory) as cur:
+                            cur.execute(query, params)
+                            return cur.fetchall()
+                    finally:
+                        if not conn.closed:
+                            conn.autocommit = False
+            except psycopg2.OperationalError as e:
+                logging.error(f"Read query attempt {attempt + 1} failed: {e}")
+                if attempt < MAX_RECONNECT_ATTEMPTS - 1:
+                    time.sleep(RECONNECT_DELAY)
+                else:
+                    raise
+
+    def execute_autocommit(self, query, params=None):
+        """Run a statement that may not run inside a transaction block (e.g. REFRESH ... CONCURRENTLY)."""
+        with self.get_connection() as conn:
+            conn.autocommit = True
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(query, params)
+            finally:
+                if not conn.closed:
+                    conn.autocommit = False
+
+    def execute_prepared(self, name, query, params, fetch=False, cursor_factory=None):
+        """Execute a server-side prepared statement, preparing it on first use per connection.
+
+        query uses $1, $2, ... placeholders and is only parsed once per connection;
+        later calls just EXECUTE it with params.
+        """
+        for attempt in range(MAX_RECONNECT_ATTEMPTS):
+            try:
+                with self.get_connection() as conn:
+                    with conn.cursor(cursor_factory=cursor_factory) as cur:
+                        if name not in conn.prepared:
+                            cur.execute(f"PREPARE {name} AS {query}")
+                            conn.prepared.add(name)
+                        placeholders = ", ".join(["%s"] * len(params))
+                        cur.execute(f"EXECUTE {name} ({placeholders})", params)
+                        if fetch:
+                            return cur.fetchall()
+                        return cur.rowcount
+            except psycopg2.OperationalError as e:
+                logging.error(f"Prepared query attempt {attempt + 1} failed: {e}")
+                if attempt < MAX_RECONNECT_ATTEMPTS - 1 and not self._in_transaction():
+                    time.sleep(RECONNECT_DELAY)
+                else:
+                    raise
+
+    def execute_many(self, query, rows, page_size=100):
+        """Execute query once per row, sending page_size rows per round trip (execute_batch)."""
+        for attempt in range(MAX_RECONNECT_ATTEMPTS):
+            try:
+                with self.get_connection() as conn:
+                    with conn.cursor() as cur:
+                        psycopg2.extras.execute_batch(cur, query, rows, page_size=page_size)
+                        return cur.rowcount
+            except psycopg2.OperationalError as e:
+                logging.error(f"Batch query attempt {attempt + 1} failed: {e}")
+                if attempt < MAX_RECONNECT_ATTEMPTS - 1 and not self._in_transaction():
+                    time.sleep(RECONNECT_DELAY)
+                else:
+                    raise
+
+    def execute_values(self, query, rows, template=None, page_size=100):
+        """Execute a multi-row statement for all rows via psycopg2.extras.execute_values.
+
+        query contains a single VALUES %s placeholder that is expanded to page_size
+        rows per round trip.
+        """
+        for attempt in range(MAX_RECONNECT_ATTEMPTS):
+            try:
+                with self.get_connection() as conn:
+                    with conn.cursor() as cur:
+                        psycopg2.extras.execute_values(cur, query, rows, template=template, page_size=page_size)
+                        return cur.rowcount
+            except psycopg2.OperationalError as e:
+                logging.error(f"Batch query attempt {attempt + 1} failed: {e}")
+                if attempt < MAX_RECONNECT_ATTEMPTS - 1 and not self._in_transaction():
+                    time.sleep(RECONNECT_DELAY)
+                else:
+                    raise
+
+    def resize(self, max_connections: int):
+        """Grow the pool so every printer can hold a connection concurrently."""
+        if max_connections <= self.max_connections:
+            return
+        old_pool = self.pool
+        self.max_connections = max_connections
+        self._initialize_pool()
+        if old_pool:
+            old_pool.closeall()
+        self.console.print(f"[dim]Database connection pool resized to {max_connections} connections.[/]")
+
     def close(self):
         """Close all connections in the pool."""
         if self.pool:
@@ -119,7 +459,8 @@ class DatabaseConnectionManager:
 class PrinterConnectionManager:
     """Manages printer connections with health checking and automatic recovery."""
     
-    def __init__(self, printer_id, name, ip, serial, access_code, db_manager, mqtt_logger=None):
+    def __init__(self, printer_id, name, ip, serial, access_code, db_manager, mqtt_logger=None, wake_event=None,
+                 ongoing_jobs=None):
         self.printer_id = printer_id
         self.name = name
         self.ip = ip
@@ -128,12 +469,24 @@ class PrinterConnectionManager:
         self.db_manager = db_manager
         self.mqtt_logger = mqtt_logger
         self.client = None
-        self.console = Console(legacy_windows=True)
+        self.console = CONSOLE
         self.consecutive_failures = 0
         self.last_successful_poll = time.time()
         self.is_connected = False
         self.lock = threading.Lock()
 
+        # Change tracking: set from the MQTT thread when a report arrives;
+        # wake_event is signalled when the reported gcode_state changes
+        self.wake_event = wake_event
+        self.dirty = True
+        self.last_processed = 0.0
+        self.last_reported_state = None
+        self.last_message_ts = 0.0
+        self.last_payload_hash = None  # raw report last written to the MQTT log
+        self.last_logged_message_ts = None  # last_message_ts when the MQTT log was last checked
+        self.last_render_key = None  # status fields last rendered to the console
+        self.last_usage_key = None  # (job, tray_now, filament rows) at the last was_used update
+
         # State tracking
         self.previous_status = None
         self.previous_filename = None
@@ -141,6 +494,8 @@ class PrinterConnectionManager:
         self.current_job_id = None
         self.needs_filament_backfill = False  # Flag to backfill filament info for loaded jobs
         self.needs_bambu_job_id_backfill = False  # Flag to backfill bambu_job_id for legacy records
+        # Unfinished jobs of all printers, fetched in bulk at startup and used by the first connect
+        self.ongoing_jobs = ongoing_jobs
     
     def connect(self) -> bool:
         """Establish connection to the printer with proper error handling."""
@@ -149,30 +504,28 @@ class PrinterConnectionManager:
                 # Clean up any existing connection
                 self._cleanup_connection()
                 
-                # Ping check first
-                if not self._ping_host():
-                    self.console.print(f"[yellow]Printer {self.name} not reachable via ping.[/]")
+                # Reachability check first
+                if not self._probe_host():
+                    self.console.print(f"[yellow]Printer {self.name} not reachable on port {PRINTER_MQTT_PORT}.[/]")
                     return False
                 
                 # Create and connect
                 self.console.print(f"Connecting to {self.name}...")
                 self.client = bl.Printer(self.ip, self.access_code, self.serial)
+                self.client.mqtt_client.on_message_handler = self._on_report
                 self.client.mqtt_start()
                 
-                # Wait for ready with timeout
-                start_time = time.time()
-                while time.time() - start_time < PRINTER_TIMEOUT:
-                    if self.client.mqtt_client.ready():
-                        self.is_connected = True
-                        self.consecutive_failures = 0
-                        self.last_successful_poll = time.time()
-                        self.console.print(f"[green]Connected to {self.name}[/]")
-
-                        # Load any ongoing job from database
-                        self._load_ongoing_job()
-
-                        return True
-                    time.sleep(0.5)
+                # Wait for the first report with timeout
+                if self.client.mqtt_client.wait_until_ready(timeout=PRINTER_TIMEOUT):
+                    self.is_connected = True
+                    self.consecutive_failures = 0
+                    self.last_successful_poll = time.time()
+                    self.console.print(f"[green]Connected to {self.name}[/]")
+
+                    # Load any ongoing job from database
+                    self._load_ongoing_job()
+
+                    return True
                 
                 # Timeout occurred
                 self._cleanup_connection()
@@ -183,39 +536,30 @@ class PrinterConnectionManager:
                 self._cleanup_connection()
                 return False
     
-    def _ping_host(self) -> bool:
-        """Ping the printer to check basic network connectivity."""
-        param = '-n' if platform.system().lower() == 'windows' else '-c'
-        command = ['ping', param, '1', self.ip]
+    def _on_report(self, mqtt_client, client, userdata, msg):
+        """MQTT callback: mark the printer for processing and wake the monitor on state changes."""
+        self.last_message_ts = time.time()
+        self.dirty = True
+        state = mqtt_client.dump().get('print', {}).get('gcode_state')
+        if state != self.last_reported_state:
+            self.last_reported_state = state
+            if self.wake_event:
+                self.wake_event.set()
+
+    def _probe_host(self) -> bool:
+        """Check that the printer accepts TCP connections on its MQTT port."""
         try:
-            # On Windows, use CREATE_NO_WINDOW flag to hide the console popup
-            startupinfo = None
-            creationflags = 0
-            if platform.system().lower() == 'windows':
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-                creationflags = subprocess.CREATE_NO_WINDOW
-
-            response = subprocess.run(
-                command,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-                timeout=3,
-                startupinfo=startupinfo,
-                creationflags=creationflags
-            )
-            return response.returncode == 0
-        except (subprocess.TimeoutExpired, Exception):
+            with socket.create_connection((self.ip, PRINTER_MQTT_PORT), timeout=PRINTER_PROBE_TIMEOUT):
+                return True
+        except OSError:
             return False
     
     def _cleanup_connection(self):
         """Clean up existing MQTT connection."""
         if self.client:
             try:
-                if hasattr(self.client, 'mqtt_client'):
-                    if self.client.mqtt_client.is_connected():
-                        self.client.mqtt_stop()
+                # loop_stop() is idempotent, so stop unconditionally
+                self.client.mqtt_stop()
             except Exception as e:
                 logging.error(f"Error during cleanup for {self.name}: {e}")
             finally:
@@ -231,22 +575,27 @@ class PrinterConnectionManager:
         _log_job_start() using the bambu_job_id.
         """
         try:
-            # Query for unfinished jobs for this printer (includes bambu_job_id for reference)
-            result = self.db_manager.execute_query(
-                """
-                SELECT id, filename, start_time, bambu_job_id
-                FROM printer_job_history
-                WHERE printer_id = %s
-                  AND end_time IS NULL
-                ORDER BY start_time DESC
-                LIMIT 1;
-                """,
-                (self.printer_id,),
-                fetch=True
-            )
+            if self.ongoing_jobs is not None:
+                ongoing_job = self.ongoing_jobs.get(self.printer_id)
+                self.ongoing_jobs = None  # reconnects read the database again
+            else:
+                # Query for unfinished jobs for this printer (includes bambu_job_id for reference)
+                result = self.db_manager.execute_read(
+                    """
+                    SELECT h.id, h.filename, h.start_time, h.bambu_job_id,
+                           EXISTS (SELECT 1 FROM printer_job_filaments f WHERE f.job_history_id = h.id)
+                    FROM printer_job_history h
+                    WHERE h.printer_id = %s
+                      AND h.end_time IS NULL
+                    ORDER BY h.start_time DESC
+                    LIMIT 1;
+                    """,
+                    (self.printer_id,)
+                )
+                ongoing_job = result[0] if result else None
 
-            if result and len(result) > 0:
-                job_id, filename, start_time, bambu_job_id = result[0]
+            if ongoing_job:
+                job_id, filename, start_time, bambu_job_id, has_filaments = ongoing_job
                 self.current_job_id = job_id
                 self.previous_filename = filename
                 self.previous_status = "RUNNING"  # Assume it's running since end_time is NULL
@@ -261,16 +610,7 @@ class PrinterConnectionManager:
                     logging.info(f"Printer {self.name}: Job {job_id} needs bambu_job_id backfill")
 
                 # Check if filament info exists for this job
-                filament_count = self.db_manager.execute_query(
-                    """
-                    SELECT COUNT(*) FROM printer_job_filaments
-                    WHERE job_history_id = %s;
-                    """,
-                    (job_id,),
-                    fetch=True
-                )
-
-                if filament_count and filament_count[0][0] == 0:
+                if not has_filaments:
                     self.needs_filament_backfill = True
                     self.console.print(f"  [yellow]No filament info found for job {job_id} - will backfill on next poll[/]")
                     logging.info(f"Printer {self.name}: Job {job_id} needs filament backfill")
@@ -311,73 +651,59 @@ class PrinterConnectionManager:
                 return False
     
     def get_status_safe(self) -> Optional[Dict]:
-        """Get printer status with timeout and error handling."""
+        """Build the printer status from the latest MQTT report, None if unavailable."""
         if not self.is_connected:
             return None
         
         with self.lock:
             try:
-                # Use threading to implement timeout for status retrieval
-                result = {}
-                error = None
-                
-                def fetch_status():
-                    nonlocal result, error
+                # Reports are pushed by the printer; a silent one has dropped off
+                if time.time() - self.last_message_ts > STALE_REPORT_TIMEOUT:
+                    raise TimeoutError(f"no report received for over {STALE_REPORT_TIMEOUT}s")
+
+                # Log the raw MQTT data to file when it changed since the last poll;
+                # without a new report since then it cannot have
+                if (self.mqtt_logger and self.last_message_ts != self.last_logged_message_ts
+                        and self.mqtt_logger.isEnabledFor(logging.INFO)):
+                    self.last_logged_message_ts = self.last_message_ts
+                    mqtt_json = json.dumps(self.client.mqtt_client.dump(), separators=(',', ':'))
+                    payload_hash = hash(mqtt_json)
+                    if payload_hash != self.last_payload_hash:
+                        self.last_payload_hash = payload_hash
+                        self.mqtt_logger.info(f"Printer: {self.name}\n{mqtt_json}")
+
+                # One consistent read of the print report instead of a getter per field
+                print_data = self.client.mqtt_client.print_snapshot()
+                ams_data = print_data.get('ams', {})
+
+                # Get subtask_id - this is Bambu's unique job identifier
+                # For cloud prints it's a large integer like 587508594
+                # For local prints it may be "0" - we'll need to handle that
+                subtask_id_raw = print_data.get('subtask_id')
+                bambu_job_id = None
+                if subtask_id_raw and subtask_id_raw != "0" and subtask_id_raw != 0:
                     try:
-                        # Get raw print data for tray_now field
-                        raw_data = self.client.mqtt_client.dump()
-
-                        # Log raw MQTT data to file
-                        if self.mqtt_logger:
-                            mqtt_json = json.dumps(raw_data, indent=2)
-                            self.mqtt_logger.info(f"Printer: {self.name}\n{mqtt_json}")
-
-                        print_data = raw_data.get('print', {})
-                        ams_data = print_data.get('ams', {})
-
-                        # Get subtask_id - this is Bambu's unique job identifier
-                        # For cloud prints it's a large integer like 587508594
-                        # For local prints it may be "0" - we'll need to handle that
-                        subtask_id_raw = print_data.get('subtask_id')
-                        bambu_job_id = None
-                        if subtask_id_raw and subtask_id_raw != "0" and subtask_id_raw != 0:
-                            try:
-                                bambu_job_id = int(subtask_id_raw)
-                            except (ValueError, TypeError):
-                                pass
-
-                        result = {
-                            'status': self.client.get_state(),
-                            'percentage': self.client.get_percentage(),
-                            'gcode_file': self.client.gcode_file(),
-                            'layer_num': self.client.current_layer_num(),
-                            'total_layer_num': self.client.total_layer_num(),
-                            'bed_temp': self.client.get_bed_temperature(),
-                            'nozzle_temp': self.client.get_nozzle_temperature(),
-                            'remaining_time_min': self.client.get_time(),
-                            'vt_tray': self._get_vt_tray_safe(),
-                            'ams_hub': self._get_ams_hub_safe(),
-                            'tray_now': ams_data.get('tray_now'),  # Active tray ID (from ams object)
-                            'tray_tar': ams_data.get('tray_tar'),  # Target tray ID (from ams object)
-                            'bambu_job_id': bambu_job_id,  # Bambu's unique job ID from subtask_id - persists across pause/resume
-                            'subtask_name': print_data.get('subtask_name'),
-                        }
-                    except Exception as e:
-                        error = e
-                
-                thread = threading.Thread(target=fetch_status)
-                thread.daemon = True
-                thread.start()
-                thread.join(timeout=PRINTER_TIMEOUT)
-                
-                if thread.is_alive():
-                    logging.error(f"Status fetch timeout for {self.name}")
-                    self.consecutive_failures += 1
-                    return None
-                
-                if error:
-                    raise error
-                
+                        bambu_job_id = int(subtask_id_raw)
+                    except (ValueError, TypeError):
+                        pass
+
+                result = {
+                    'status': bl.GcodeState(print_data.get('gcode_state', -1)),
+                    'percentage': _as_number(print_data.get('mc_percent')),
+                    'gcode_file': print_data.get('gcode_file'),
+                    'layer_num': int(print_data.get('layer_num', 0)),
+                    'total_layer_num': int(print_data.get('total_layer_num', 0)),
+                    'bed_temp': float(print_data.get('bed_temper', 0.0)),
+                    'nozzle_temp': float(print_data.get('nozzle_temper', 0.0)),
+                    'remaining_time_min': _as_number(print_data.get('mc_remaining_time')),
+                    'vt_tray': self._get_vt_tray_safe(print_data),
+                    'ams_hub': self._get_ams_hub_safe(),
+                    'tray_now': ams_data.get('tray_now'),  # Active tray ID (from ams object)
+                    'tray_tar': ams_data.get('tray_tar'),  # Target tray ID (from ams object)
+                    'bambu_job_id': bambu_job_id,  # Bambu's unique job ID from subtask_id - persists across pause/resume
+                    'subtask_name': print_data.get('subtask_name'),
+                }
+
                 self.consecutive_failures = 0
                 self.last_successful_poll = time.time()
                 return result
@@ -393,15 +719,15 @@ class PrinterConnectionManager:
                 
                 return None
     
-    def _get_vt_tray_safe(self):
-        """Safely get vt_tray information."""
+    def _get_vt_tray_safe(self, print_data: Dict):
+        """Build the external spool tray from an already-read print report, None if absent."""
+        vt_tray_data = print_data.get('vt_tray')
+        if not isinstance(vt_tray_data, dict):
+            return None
         try:
-            vt_tray_data = self.client.mqtt_client._PrinterMQTTClient__get_print("vt_tray")
-            if vt_tray_data is not None and isinstance(vt_tray_data, dict):
-                return self.client.vt_tray()
+            return bl.FilamentTray.from_dict(vt_tray_data)
         except Exception:
             return None
-        return None
     
     def _get_ams_hub_safe(self):
         """Safely get AMS hub information."""
@@ -425,15 +751,40 @@ class SafePrinterMonitor:
     """Main monitoring class with enhanced safety features."""
     
     def __init__(self):
-        self.console = Console(legacy_windows=True)
+        self.console = CONSOLE
         self.db_manager = DatabaseConnectionManager()
         self.printer_managers = []
         self.unreachable_printers = []
-        self.running = True
+        self.stop_event = threading.Event()  # set by SIGINT/SIGTERM or shutdown()
+        self.wake_event = threading.Event()  # set by printers whose gcode_state changed
+        # Live status view, used only when attached to a terminal (not under pm2)
+        self.live: Optional[Live] = None
+        self.status_views: Dict[int, Group] = {}
+        # Long-lived pool for status polls; threads are started on demand
+        self.poll_executor = ThreadPoolExecutor(max_workers=MAX_POLL_WORKERS, thread_name_prefix="printer-poll")
+        # Single writer for the per-cycle status batch so the loop never waits on it;
+        # one worker keeps the batches in cycle order
+        self.db_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer")
         self.RETRY_INTERVAL_SECONDS = 60  # Retry every 60 seconds instead of 300
         self.last_retry_attempt_time = 0
         self.FULL_RECONNECT_INTERVAL = 300  # Full reconnect every 5 minutes
-        self.last_full_reconnect_time = time.time()
+        self.last_full_reconnect_time = time.monotonic()
+        self.filament_profile_cache: OrderedDict[str, Tuple[float, Optional[Dict]]] = OrderedDict()
+        self.profile_cache_reset = threading.Event()  # set by SIGHUP
+        # printers-table rows gathered during a cycle, handed to db_writer by _flush_printer_updates
+        self.pending_updates: List[Tuple] = []
+        # Last filament configuration written per printer, to skip unchanged upserts
+        self.filament_signatures: Dict[int, Tuple] = {}
+        # Open jobs whose job-start filament rows are already written
+        self.filaments_logged: set = set()
+        self.external_spool_conflict = EXTERNAL_SPOOL_CONFLICT
+        # Set when a job ends; the summary view is refreshed once that tick's transaction commits
+        self.filament_summary_stale = False
+        # Clocks read once per monitoring cycle and shared by every printer;
+        # cycle_tick (monotonic) drives the interval gates
+        self.cycle_now = datetime.datetime.now()
+        self.cycle_now_ts = self.cycle_now.timestamp()
+        self.cycle_tick = time.monotonic()
 
         # Set up logging
         self._setup_logging()
@@ -473,7 +824,8 @@ class SafePrinterMonitor:
             maxBytes=100*1024,  # 100KB for ~200 lines
             backupCount=1  # Keep only 1 backup file
         )
-        mqtt_formatter = logging.Formatter('%(asctime)s - %(message)s')
+        # Epoch seconds instead of asctime: no strftime per record on the noisiest logger
+        mqtt_formatter = logging.Formatter('%(created).3f - %(message)s')
         mqtt_file_handler.setFormatter(mqtt_formatter)
         mqtt_logger.addHandler(mqtt_file_handler)
 
@@ -483,34 +835,88 @@ class SafePrinterMonitor:
     def initialize_printers(self):
         """Initialize all printers from database where in_production is true."""
         try:
-            printers_data = self.db_manager.execute_query(
-                "SELECT printer_id, printer_name, printer_ip, printer_bambu_id, access_code FROM printers WHERE in_production = true;",
-                fetch=True
+            printers_data = self.db_manager.execute_read(
+                "SELECT printer_id, printer_name, printer_ip, printer_bambu_id, access_code FROM printers WHERE in_production = true;"
             )
             
             if not printers_data:
                 self.console.print("[yellow]No printers found in database.[/]")
                 return
+
+            # Size the pool to the printer fan-out so per-printer DB work never waits on a checkout
+            self.db_manager.resize(len(printers_data))
+            self._detect_filament_indexes()
+
+            ongoing_jobs = self._fetch_ongoing_jobs([row[0] for row in printers_data])
             
+            managers = []
             for printer_id, name, ip, serial, access_code in printers_data:
                 if not all([printer_id, ip, serial, access_code]):
                     self.console.print(f"[yellow]Skipping {name} due to missing data.[/]")
                     continue
                 
-                manager = PrinterConnectionManager(
-                    printer_id, name, ip, serial, access_code, self.db_manager, self.mqtt_logger
-                )
-                
-                if manager.connect():
+                managers.append(PrinterConnectionManager(
+                    printer_id, name, ip, serial, access_code, self.db_manager, self.mqtt_logger, self.wake_event,
+                    ongoing_jobs
+                ))
+
+            # Connect concurrently; each attempt may wait up to PRINTER_TIMEOUT for a first report
+            connected = self._connect_all(managers)
+            for manager, ok in zip(managers, connected):
+                if ok:
                     self.printer_managers.append(manager)
                 else:
                     self.unreachable_printers.append(
-                        (printer_id, name, ip, serial, access_code)
+                        (manager.printer_id, manager.name, manager.ip, manager.serial, manager.access_code)
                     )
             
         except Exception as e:
             logging.error(f"Failed to initialize printers: {e}")
             raise
+
+    def _detect_filament_indexes(self):
+        """Fall back to the legacy external spool upsert target if the partial index migration is missing."""
+        try:
+            rows = self.db_manager.execute_read("SELECT to_regclass('uq_job_filaments_external') IS NOT NULL;")
+            has_index = bool(rows and rows[0][0])
+        except Exception as e:
+            logging.error(f"Failed to check printer_job_filaments indexes: {e}")
+            has_index = False
+        if not has_index:
+            self.external_spool_conflict = LEGACY_EXTERNAL_SPOOL_CONFLICT
+            self.console.print("[yellow]uq_job_filaments_external not found; apply "
+                               "database/migrations/add_partial_unique_job_filament_indexes.sql[/]")
+
+    def _connect_all(self, managers: List[PrinterConnectionManager]) -> List[bool]:
+        """Connect the given printers concurrently, returning each connect() result in order."""
+        if not managers:
+            return []
+        with ThreadPoolExecutor(max_workers=min(MAX_RETRY_WORKERS, len(managers))) as executor:
+            return list(executor.map(PrinterConnectionManager.connect, managers))
+
+    def _fetch_ongoing_jobs(self, printer_ids: List[int]) -> Optional[Dict[int, Tuple]]:
+        """Return each printer's latest unfinished job and whether it has filament rows, in one query.
+
+        Rows are (job_id, filename, start_time, bambu_job_id, has_filaments) keyed by
+        printer_id. Returns None on failure so printers fall back to their own lookup.
+        """
+        try:
+            rows = self.db_manager.execute_read(
+                """
+                SELECT DISTINCT ON (h.printer_id)
+                       h.printer_id, h.id, h.filename, h.start_time, h.bambu_job_id,
+                       EXISTS (SELECT 1 FROM printer_job_filaments f WHERE f.job_history_id = h.id)
+                FROM printer_job_history h
+                WHERE h.printer_id = ANY(%s)
+                  AND h.end_time IS NULL
+                ORDER BY h.printer_id, h.start_time DESC;
+                """,
+                (printer_ids,)
+            )
+            return {row[0]: row[1:] for row in rows}
+        except Exception as e:
+            logging.error(f"Failed to load ongoing jobs: {e}")
+            return None
     
     def monitor_loop(self):
         """Main monitoring loop with enhanced error handling."""
@@ -519,83 +925,209 @@ class SafePrinterMonitor:
         self.console.print(f"{len(self.unreachable_printers)} printers currently unreachable")
         self.console.print("[yellow]Press Ctrl+C to stop[/]\n")
         
+        # Stop promptly on Ctrl+C or a pm2 stop, even mid-wait
+        signal.signal(signal.SIGINT, self._handle_stop_signal)
+        signal.signal(signal.SIGTERM, self._handle_stop_signal)
+        # SIGHUP (not available on Windows) drops cached filament profiles after a profile import
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, self._handle_reload_signal)
+
+        if self.console.is_terminal:
+            self.live = Live(console=self.console.console, auto_refresh=False)
+            self.live.start()
+        try:
+            self._run_cycles()
+            self.console.print("\n[yellow]Stopping monitoring...[/]")
+        finally:
+            if self.live:
+                self.live.stop()
+                self.live = None
+
+    def _handle_stop_signal(self, signum, frame):
+        """Signal handler: end the monitoring loop after the current step."""
+        self.stop_event.set()
+        self.wake_event.set()
+
+    def _handle_reload_signal(self, signum, frame):
+        """Signal handler: clear the filament profile cache at the start of the next cycle."""
+        self.profile_cache_reset.set()
+        self.wake_event.set()
+
+    def _run_cycles(self):
+        """Run monitoring cycles until stopped."""
         cycle_count = 0
-        while self.running:
+        while not self.stop_event.is_set():
             try:
                 cycle_count += 1
-                self.console.print(f"\n[dim]{'='*50}[/]")
-                self.console.print(f"[bold cyan]Monitoring Cycle #{cycle_count}[/] - {datetime.datetime.now().strftime('%H:%M:%S')}")
-                self.console.print(f"[dim]{'='*50}[/]")
+                self.cycle_now = datetime.datetime.now()
+                self.cycle_now_ts = self.cycle_now.timestamp()
+                self.cycle_tick = time.monotonic()
+                if self.profile_cache_reset.is_set():
+                    self.profile_cache_reset.clear()
+                    self.filament_profile_cache.clear()
+                    self.console.print("[dim]Filament profile cache cleared[/]")
+                if MONITOR_VERBOSE:
+                    self.console.print(
+                        f"\n{_CYCLE_RULE}\n"
+                        f"[bold cyan]Monitoring Cycle #{cycle_count}[/] - {self.cycle_now:%H:%M:%S}\n"
+                        f"{_CYCLE_RULE}"
+                    )
                 
-                # Monitor active printers
-                for manager in self.printer_managers[:]:  # Copy list to allow modification
-                    if not self._monitor_printer(manager):
+                # Poll printers that sent new reports (or have been quiet too long)
+                # concurrently, then process results in order. The wake event is cleared
+                # first, so a state change reported during this cycle wakes the next wait
+                self.wake_event.clear()
+                now = self.cycle_tick
+                managers = [
+                    m for m in self.printer_managers
+                    if m.dirty or now - m.last_processed >= QUIET_PRINTER_REFRESH
+                ]
+                skipped = len(self.printer_managers) - len(managers)
+                if skipped:
+                    self.console.print(f"{skipped} printer(s) unchanged since last cycle", style="dim", markup=False, highlight=False)
+                poll_results = list(self.poll_executor.map(self._poll_printer, managers))
+
+                # Look up every printer's filament profiles at once so per-printer
+                # processing below is served from the cache
+                self._prefetch_cycle_filament_profiles(
+                    [status_data for _, status_data in poll_results if status_data]
+                )
+
+                to_remove = set()
+                for manager, (healthy, status_data) in zip(managers, poll_results):
+                    if healthy and status_data:
+                        healthy = self._monitor_printer(manager, status_data)
+                    if not healthy:
                         # Move to unreachable if monitoring fails
                         self.console.print(f"[red]Moving {manager.name} to unreachable list[/]")
-                        self.printer_managers.remove(manager)
+                        to_remove.add(manager)
+                        self.status_views.pop(manager.printer_id, None)
                         self.unreachable_printers.append(
                             (manager.printer_id, manager.name, manager.ip, 
                              manager.serial, manager.access_code)
                         )
                         manager.disconnect()
+                if to_remove:
+                    self.printer_managers = [m for m in self.printer_managers if m not in to_remove]
                 
+                self._flush_printer_updates()
+
+                # Repaint the live status view once per cycle
+                if self.live:
+                    self.live.update(Group(*self.status_views.values()), refresh=True)
+
                 # Attempt to reconnect unreachable printers
                 self._retry_unreachable_printers()
 
                 # Periodic full reconnect to refresh MQTT connections
                 self._periodic_full_reconnect()
 
-                # Status summary
-                self.console.print(f"\n[dim]Active: {len(self.printer_managers)} | Unreachable: {len(self.unreachable_printers)}[/]")
+                # Status summary, written as one line per cycle
+                summary = [f"Cycle #{cycle_count} {self.cycle_now:%H:%M:%S}",
+                           f"Active: {len(self.printer_managers)}",
+                           f"Unreachable: {len(self.unreachable_printers)}"]
                 if self.unreachable_printers:
-                    time_since_retry = time.time() - self.last_retry_attempt_time
-                    next_retry_in = max(0, int(self.RETRY_INTERVAL_SECONDS - time_since_retry))
-                    self.console.print(f"[dim]Next reconnect attempt in {next_retry_in}s[/]")
-                time_since_full_reconnect = time.time() - self.last_full_reconnect_time
-                next_full_reconnect_in = max(0, int(self.FULL_RECONNECT_INTERVAL - time_since_full_reconnect))
-                self.console.print(f"[dim]Next full reconnect in {next_full_reconnect_in}s[/]")
-                self.console.print(f"[dim]Next check in 10 seconds...[/]")
+                    time_since_retry = self.cycle_tick - self.last_retry_attempt_time
+                    summary.append(f"reconnect in {max(0, int(self.RETRY_INTERVAL_SECONDS - time_since_retry))}s")
+                time_since_full_reconnect = self.cycle_tick - self.last_full_reconnect_time
+                summary.append(f"full reconnect in {max(0, int(self.FULL_RECONNECT_INTERVAL - time_since_full_reconnect))}s")
+                summary.append(f"next check in {MONITOR_INTERVAL:g}s")
+                self.console.print(" | ".join(summary), style="dim", markup=False, highlight=False)
                 
-                # Health check interval
-                time.sleep(10)
+                # Wait for the next cycle, waking early if a printer's state changes
+                self.wake_event.wait(timeout=MONITOR_INTERVAL)
                 
-            except KeyboardInterrupt:
-                self.console.print("\n[yellow]Stopping monitoring...[/]")
-                self.running = False
             except Exception as e:
                 logging.error(f"Error in monitor loop: {e}")
                 self.console.print(f"[red]Error in monitoring loop: {e}[/]")
                 self.console.print("[yellow]Retrying in 30 seconds...[/]")
-                time.sleep(30)  # Wait before retrying
+                self.stop_event.wait(30)  # Wait before retrying
     
-    def _monitor_printer(self, manager: PrinterConnectionManager) -> bool:
-        """Monitor a single printer, return False if it should be moved to unreachable."""
+    def _poll_printer(self, manager: PrinterConnectionManager) -> Tuple[bool, Optional[Dict]]:
+        """Fetch a printer's status; runs on a worker thread.
+
+        Returns (healthy, status_data). healthy is False if the printer should
+        be moved to unreachable; status_data is None when nothing was fetched.
+        """
+        # Clear before fetching so reports arriving mid-poll mark it again
+        manager.dirty = False
         try:
-            # Check connection health
-            if not manager.check_health():
+            # Check connection health, unless a recent successful poll already showed it
+            recently_polled = time.time() - manager.last_successful_poll < PRINTER_HEALTH_CHECK_INTERVAL
+            if not (manager.is_connected and recently_polled) and not manager.check_health():
                 if manager.consecutive_failures >= MAX_CONSECUTIVE_FAILURES:
                     self.console.print(f"[red]{manager.name} marked as unreachable.[/]")
-                    return False
+                    return False, None
                 # Try to reconnect
                 if not manager.reconnect():
-                    return False
+                    return False, None
             
             # Get status safely
             status_data = manager.get_status_safe()
             if not status_data:
-                return manager.consecutive_failures < MAX_CONSECUTIVE_FAILURES
+                manager.dirty = True  # retry next cycle
+                return manager.consecutive_failures < MAX_CONSECUTIVE_FAILURES, None
+            
+            manager.last_processed = self.cycle_tick
+            return True, status_data
             
-            # Process and display status
-            self._process_printer_status(manager, status_data)
+        except Exception as e:
+            logging.error(f"Error polling {manager.name}: {e}")
+            return False, None
+
+    def _monitor_printer(self, manager: PrinterConnectionManager, status_data: Dict) -> bool:
+        """Process a polled status, return False if it should be moved to unreachable."""
+        try:
+            # Process and display status; its database writes commit together
+            saved_state = self._save_job_state(manager)
+            self.filament_summary_stale = False
+            try:
+                with self.db_manager.transaction():
+                    self._process_printer_status(manager, status_data)
+            except psycopg2.Error as e:
+                logging.error(f"Database updates for {manager.name} were rolled back: {e}")
+                # Forget what the rolled-back statements did so the next tick redoes them
+                self._restore_job_state(manager, saved_state)
+            else:
+                if self.filament_summary_stale:
+                    self._refresh_filament_summary()
             return True
             
         except Exception as e:
             logging.error(f"Error monitoring {manager.name}: {e}")
             return False
     
+    def _save_job_state(self, manager: PrinterConnectionManager) -> Tuple:
+        """Capture the job tracking state that a printer's status processing may change."""
+        return (
+            manager.previous_status,
+            manager.previous_filename,
+            manager.current_job_id,
+            manager.last_usage_key,
+            manager.needs_filament_backfill,
+            manager.needs_bambu_job_id_backfill,
+            self.filament_signatures.get(manager.printer_id),
+            set(self.filaments_logged),
+        )
+
+    def _restore_job_state(self, manager: PrinterConnectionManager, saved_state: Tuple):
+        """Undo the in-memory effects of a rolled-back status update."""
+        (manager.previous_status,
+         manager.previous_filename,
+         manager.current_job_id,
+         manager.last_usage_key,
+         manager.needs_filament_backfill,
+         manager.needs_bambu_job_id_backfill,
+         signature,
+         self.filaments_logged) = saved_state
+        if signature is None:
+            self.filament_signatures.pop(manager.printer_id, None)
+        else:
+            self.filament_signatures[manager.printer_id] = signature
+
     def _retry_unreachable_printers(self):
         """Periodically retry connecting to unreachable printers."""
-        current_time = time.time()
+        current_time = self.cycle_tick
         if not self.unreachable_printers:
             return
         
@@ -606,32 +1138,42 @@ class SafePrinterMonitor:
         unreachable_names = [p[1] for p in self.unreachable_printers]
         self.console.print(f"[blue]Retrying {len(self.unreachable_printers)} unreachable printers: {', '.join(unreachable_names)}[/]")
 
-        reconnected = []
-        for printer_data in self.unreachable_printers:
-            printer_id, name, ip, serial, access_code = printer_data
-            self.console.print(f"  [dim]Attempting to reconnect to {name} ({ip})...[/]")
+        # Retry concurrently so one slow printer doesn't hold up the others
+        with ThreadPoolExecutor(max_workers=min(MAX_RETRY_WORKERS, len(self.unreachable_printers))) as executor:
+            results = list(executor.map(self._try_reconnect, self.unreachable_printers))
 
-            manager = PrinterConnectionManager(
-                printer_id, name, ip, serial, access_code, self.db_manager, self.mqtt_logger
-            )
-
-            if manager.connect():
+        reconnected_ids = set()
+        for printer_data, manager in zip(self.unreachable_printers, results):
+            if manager is not None:
                 self.printer_managers.append(manager)
-                reconnected.append(printer_data)
-                self.console.print(f"  [green]✓ Reconnected to {name}[/]")
-            else:
-                self.console.print(f"  [yellow]✗ Failed to reconnect to {name} - will retry in {self.RETRY_INTERVAL_SECONDS}s[/]")
+                reconnected_ids.add(printer_data[0])
+
+        # Remove reconnected printers from unreachable list in one pass
+        if reconnected_ids:
+            self.unreachable_printers = [
+                p for p in self.unreachable_printers if p[0] not in reconnected_ids
+            ]
+            self.console.print(f"[green]Successfully reconnected {len(reconnected_ids)} printer(s)[/]")
+
+    def _try_reconnect(self, printer_data: Tuple) -> Optional[PrinterConnectionManager]:
+        """Attempt to reconnect an unreachable printer; runs on a worker thread."""
+        printer_id, name, ip, serial, access_code = printer_data
+        self.console.print(f"  [dim]Attempting to reconnect to {name} ({ip})...[/]")
+
+        manager = PrinterConnectionManager(
+            printer_id, name, ip, serial, access_code, self.db_manager, self.mqtt_logger, self.wake_event
+        )
 
-        # Remove reconnected printers from unreachable list
-        for printer_data in reconnected:
-            self.unreachable_printers.remove(printer_data)
+        if manager.connect():
+            self.console.print(f"  [green]✓ Reconnected to {name}[/]")
+            return manager
 
-        if reconnected:
-            self.console.print(f"[green]Successfully reconnected {len(reconnected)} printer(s)[/]")
+        self.console.print(f"  [yellow]✗ Failed to reconnect to {name} - will retry in {self.RETRY_INTERVAL_SECONDS}s[/]")
+        return None
 
     def _periodic_full_reconnect(self):
         """Perform a full reconnect of all printers every 5 minutes to refresh MQTT connections."""
-        current_time = time.time()
+        current_time = self.cycle_tick
         if current_time - self.last_full_reconnect_time < self.FULL_RECONNECT_INTERVAL:
             return
 
@@ -658,16 +1200,19 @@ class SafePrinterMonitor:
 
         self.printer_managers.clear()
 
-        # Reconnect all printers
-        reconnected_count = 0
+        # Reconnect all printers concurrently
+        managers = []
         for printer_info in printers_to_reconnect:
             self.console.print(f"  [dim]Reconnecting to {printer_info['name']}...[/]")
-            manager = PrinterConnectionManager(
+            managers.append(PrinterConnectionManager(
                 printer_info['printer_id'], printer_info['name'], printer_info['ip'],
-                printer_info['serial'], printer_info['access_code'], self.db_manager, self.mqtt_logger
-            )
+                printer_info['serial'], printer_info['access_code'], self.db_manager, self.mqtt_logger, self.wake_event
+            ))
+        connected = self._connect_all(managers)
 
-            if manager.connect():
+        reconnected_count = 0
+        for printer_info, manager, ok in zip(printers_to_reconnect, managers, connected):
+            if ok:
                 # Restore job tracking state (don't let _load_ongoing_job override if we have state)
                 if printer_info['current_job_id'] is not None:
                     manager.current_job_id = printer_info['current_job_id']
@@ -694,7 +1239,7 @@ class SafePrinterMonitor:
         try:
             # Extract status data
             status = status_data.get('status', 'UNKNOWN')
-            percentage = status_data.get('percentage', 0)
+            percentage = status_data.get('percentage')
             gcode_file = status_data.get('gcode_file') or 'N/A'
             layer_num = status_data.get('layer_num', 0)
             total_layer_num = status_data.get('total_layer_num', 0)
@@ -702,57 +1247,16 @@ class SafePrinterMonitor:
             nozzle_temp = status_data.get('nozzle_temp', 0)
             remaining_time_min = status_data.get('remaining_time_min')
             
-            # Format status with color
-            status_color = "white"
-            if status == "RUNNING": status_color = "green"
-            elif status == "FINISH": status_color = "blue"
-            elif status == "FAILED": status_color = "red"
-            elif status == "IDLE": status_color = "yellow"
-            status_str = f"[{status_color}]{status}[/]"
-            
-            # Format progress bar
-            progress_bar = "[dim]N/A[/]"
-            if isinstance(percentage, (int, float)) and 0 <= percentage <= 100:
-                bar_length = 20
-                filled_length = int(bar_length * percentage / 100)
-                bar = '#' * filled_length + '-' * (bar_length - filled_length)
-                progress_bar = f"[cyan]|{bar}| {percentage:.1f}%[/]"
-            
-            # Format finish time
-            finish_time_str = "[dim]N/A[/]"
-            if isinstance(remaining_time_min, (int, float)) and remaining_time_min >= 0:
-                try:
-                    finish_time = datetime.datetime.now() + datetime.timedelta(minutes=int(remaining_time_min))
-                    finish_time_str = finish_time.strftime("%H:%M:%S")
-                except:
-                    pass
-            
-            # Create display table
-            table = Table(show_header=False, box=None, padding=(0, 1))
-            table.add_column("Attribute", style="dim", width=12)
-            table.add_column("Value")
-            
-            self.console.print(f"\n[bold magenta]{manager.name}[/] (ID: {manager.printer_id})")
-            table.add_row("Status", status_str)
-            table.add_row("Progress", progress_bar)
-            table.add_row("File", f"[cyan]{gcode_file}[/]")
-            table.add_row("Layer", f"{layer_num}/{total_layer_num}")
-            table.add_row("Temps", f"Bed: {bed_temp}°C, Nozzle: {nozzle_temp}°C")
-            table.add_row("Est. Finish", finish_time_str)
-
-            # Add tray_now info if available
+            # Skip rendering unless a shown field changed; temperatures and progress
+            # are compared coarsely so sensor jitter doesn't force a repaint
             tray_now = status_data.get('tray_now')
-            if tray_now is not None:
-                tray_now_int = int(tray_now) if isinstance(tray_now, str) else tray_now
-                if tray_now_int < 16:
-                    ams_id = tray_now_int // 4
-                    tray_id = tray_now_int % 4
-                    table.add_row("Active Tray", f"AMS {ams_id}, Tray {tray_id}")
-                elif tray_now_int in [254, 255]:
-                    table.add_row("Active Tray", "External Spool")
+            render_key = (status, gcode_file, layer_num, total_layer_num, round(bed_temp), round(nozzle_temp),
+                          None if percentage is None else int(percentage), remaining_time_min, tray_now)
+            if render_key != manager.last_render_key:
+                self._render_printer_status(manager, status, percentage, gcode_file, layer_num, total_layer_num,
+                                            bed_temp, nozzle_temp, remaining_time_min, tray_now)
+                manager.last_render_key = render_key
 
-            self.console.print(table)
-            
             # Update database
             self._update_printer_database(manager, status, remaining_time_min, gcode_file, percentage)
 
@@ -766,41 +1270,126 @@ class SafePrinterMonitor:
         except Exception as e:
             logging.error(f"Error processing status for {manager.name}: {e}")
     
+    def _render_printer_status(self, manager: PrinterConnectionManager, status, percentage, gcode_file,
+                               layer_num, total_layer_num, bed_temp, nozzle_temp, remaining_time_min, tray_now):
+        """Render a printer's status table to the console or the live view."""
+        # Format status with color
+        status_str = f"[{_STATUS_COLORS.get(status, 'white')}]{status}[/]"
+        
+        # Format progress bar
+        progress_bar = _NA
+        if percentage is not None and 0 <= percentage <= 100:
+            bar = _PROGRESS_BARS[int(_PROGRESS_BAR_LENGTH * percentage / 100)]
+            progress_bar = f"[cyan]|{bar}| {percentage:.1f}%[/]"
+        
+        # Format finish time
+        finish_time_str = _NA
+        if remaining_time_min is not None and remaining_time_min >= 0:
+            try:
+                finish_time = self.cycle_now + datetime.timedelta(minutes=int(remaining_time_min))
+                finish_time_str = finish_time.strftime("%H:%M:%S")
+            except:
+                pass
+        
+        # Collect display rows, then build the table in one pass
+        rows = [
+            ("Status", status_str),
+            ("Progress", progress_bar),
+            ("File", f"[cyan]{gcode_file}[/]"),
+            ("Layer", f"{layer_num}/{total_layer_num}"),
+            ("Temps", f"Bed: {bed_temp}°C, Nozzle: {nozzle_temp}°C"),
+            ("Est. Finish", finish_time_str),
+        ]
+
+        # Add tray_now info if available
+        tray_now_int, ams_id, tray_id = _decode_tray_now(tray_now)
+        if ams_id is not None:
+            rows.append(("Active Tray", f"AMS {ams_id}, Tray {tray_id}"))
+        elif tray_now_int in _EXTERNAL_SPOOL_TRAYS:
+            rows.append(("Active Tray", "External Spool"))
+
+        table = Table(show_header=False, box=None, padding=(0, 1))
+        table.add_column("Attribute", style="dim", width=12)
+        table.add_column("Value")
+        add_row = table.add_row
+        for label, value in rows:
+            add_row(label, value)
+
+        header = f"\n[bold magenta]{manager.name}[/] (ID: {manager.printer_id})"
+        if self.live:
+            self.status_views[manager.printer_id] = Group(header, table)
+        else:
+            self.console.print(header)
+            self.console.print(table)
+
     def _update_printer_database(self, manager, status, remaining_time_min, gcode_file, percentage):
-        """Update printer status in database."""
-        try:
-            remaining_seconds = None
-            if isinstance(remaining_time_min, (int, float)) and remaining_time_min >= 0:
-                remaining_seconds = int(remaining_time_min * 60)
+        """Queue the printer's status for this cycle's batched printers update."""
+        remaining_seconds = None
+        if remaining_time_min is not None and remaining_time_min >= 0:
+            remaining_seconds = int(remaining_time_min * 60)
 
-            progress_float = None
-            if isinstance(percentage, (int, float)) and 0 <= percentage <= 100:
-                progress_float = float(percentage)
+        progress_float = None
+        if percentage is not None and 0 <= percentage <= 100:
+            progress_float = float(percentage)
 
-            # Use Python datetime for timezone consistency
-            poll_time = datetime.datetime.now()
+        # Use Python datetime for timezone consistency
+        self.pending_updates.append(
+            (status, self.cycle_now, remaining_seconds, gcode_file if gcode_file != 'N/A' else None,
+             progress_float, manager.printer_id)
+        )
+
+    def _flush_printer_updates(self):
+        """Hand the printer statuses queued this cycle to the background writer."""
+        if not self.pending_updates:
+            return
+        rows, self.pending_updates = self.pending_updates, []
+        self.db_writer.submit(self._write_printer_updates, rows)
+
+    def _write_printer_updates(self, rows: List[Tuple]):
+        """Write a cycle's printer statuses with a single statement."""
+        try:
+            if PRINTER_LIVE_STATUS:
+                self.db_manager.execute_values(
+                    """
+                    INSERT INTO printer_live_status (
+                        last_poll_status, last_polled_at, remaining_time,
+                        current_print_job, print_progress, printer_id
+                    ) VALUES %s
+                    ON CONFLICT (printer_id) DO UPDATE SET
+                        last_poll_status = EXCLUDED.last_poll_status,
+                        last_polled_at = EXCLUDED.last_polled_at,
+                        remaining_time = EXCLUDED.remaining_time,
+                        current_print_job = EXCLUDED.current_print_job,
+                        print_progress = EXCLUDED.print_progress;
+                    """,
+                    rows
+                )
+                return
 
-            self.db_manager.execute_query(
+            # Casts keep the column types when every row of a column is NULL
+            self.db_manager.execute_values(
                 """
-                UPDATE printers
-                SET last_poll_status = %s,
-                    last_polled_at = %s,
-                    remaining_time = %s,
-                    current_print_job = %s,
-                    Print_Progress = %s
-                WHERE printer_id = %s;
+                UPDATE printers AS p
+                SET last_poll_status = v.status,
+                    last_polled_at = v.polled_at,
+                    remaining_time = v.remaining,
+                    current_print_job = v.job,
+                    Print_Progress = v.progress
+                FROM (VALUES %s) AS v(status, polled_at, remaining, job, progress, printer_id)
+                WHERE p.printer_id = v.printer_id;
                 """,
-                (status, poll_time, remaining_seconds, gcode_file if gcode_file != 'N/A' else None,
-                 progress_float, manager.printer_id)
+                rows,
+                template="(%s, %s, %s::integer, %s::text, %s::numeric, %s)"
             )
         except Exception as e:
-            logging.error(f"Failed to update database for {manager.name}: {e}")
+            logging.error(f"Failed to update printer statuses in database: {e}")
     
     def _log_job_event(self, manager, status, gcode_file, remaining_time_min, percentage, status_data: Dict):
         """Log job start/end events."""
         try:
             is_running = status == "RUNNING"
             was_running = manager.previous_status == "RUNNING"
+            active_filament_info = None  # extracted at most once per tick, see below
 
             # Check if we need to backfill bambu_job_id for a loaded ongoing job (legacy record)
             if manager.needs_bambu_job_id_backfill and manager.current_job_id and is_running:
@@ -818,43 +1407,53 @@ class SafePrinterMonitor:
                     manager.needs_bambu_job_id_backfill = False
                     logging.info(f"Printer {manager.name}: Backfilled bambu_job_id {bambu_job_id} for job {manager.current_job_id}")
                 else:
-                    self.console.print(f"  [yellow]Cannot backfill bambu_job_id - not available in status data yet[/]")
+                    self.console.print("  Cannot backfill bambu_job_id - not available in status data yet", style="yellow", markup=False, highlight=False)
 
             # Check if we need to backfill filament info for a loaded ongoing job
             if manager.needs_filament_backfill and manager.current_job_id and is_running:
                 self.console.print(f"  [cyan]Backfilling filament info for job {manager.current_job_id}...[/]")
-                self._log_job_filaments(manager.current_job_id, manager.printer_id, status_data)
+                active_filament_info = self._extract_filament_info(status_data)
+                self._log_job_filaments(manager.current_job_id, manager.printer_id, status_data, active_filament_info)
                 manager.needs_filament_backfill = False
                 logging.info(f"Printer {manager.name}: Backfilled filament info for job {manager.current_job_id}")
 
             # Job start detection (fresh start)
             if not was_running and is_running and gcode_file and gcode_file != 'N/A':
-                self.console.print(f"  [dim]DEBUG: Detected job START (was_running={was_running}, is_running={is_running})[/]")
+                if MONITOR_VERBOSE:
+                    self.console.print(f"  DEBUG: Detected job START (was_running={was_running}, is_running={is_running})", style="dim", markup=False, highlight=False)
                 self._log_job_start(manager, status, gcode_file, remaining_time_min, percentage, status_data)
 
             # Job already running but we don't have current_job_id - try to recover/create it
             elif is_running and manager.current_job_id is None and gcode_file and gcode_file != 'N/A':
-                self.console.print(f"  [yellow]DEBUG: Job running but no current_job_id - recovering...[/]")
+                if MONITOR_VERBOSE:
+                    self.console.print("  DEBUG: Job running but no current_job_id - recovering...", style="yellow", markup=False, highlight=False)
                 self._log_job_start(manager, status, gcode_file, remaining_time_min, percentage, status_data)
 
             # During print: update filament records and track usage changes
             elif is_running and manager.current_job_id:
-                self.console.print(f"  [dim]DEBUG: Job RUNNING, updating filaments (job_id={manager.current_job_id})[/]")
+                if MONITOR_VERBOSE:
+                    self.console.print(f"  DEBUG: Job RUNNING, updating filaments (job_id={manager.current_job_id})", style="dim", markup=False, highlight=False)
                 # Update/create filament records on each cycle (handles AMS changes mid-print)
-                self._update_job_filaments(manager.current_job_id, manager.printer_id, status_data)
-                # Track which filaments are actively being used
-                self._update_filament_usage(manager.current_job_id, status_data)
+                self._update_job_filaments(manager.current_job_id, manager.printer_id, status_data, active_filament_info)
+                # Track which filaments are actively being used; only needed when the
+                # active tray or the job's filament rows changed since the last update
+                usage_key = (manager.current_job_id, status_data.get('tray_now'),
+                             self.filament_signatures.get(manager.printer_id))
+                if usage_key != manager.last_usage_key and self._update_filament_usage(manager.current_job_id, status_data):
+                    manager.last_usage_key = usage_key
 
             # Job end detection - multiple scenarios
             # Scenario 1: Normal transition from RUNNING to non-RUNNING with current_job_id
             # This is the most reliable - we have the job ID tracked
             elif not is_running and manager.current_job_id is not None:
-                self.console.print(f"  [dim]DEBUG: Detected job END (job_id={manager.current_job_id}, status={status})[/]")
+                if MONITOR_VERBOSE:
+                    self.console.print(f"  DEBUG: Detected job END (job_id={manager.current_job_id}, status={status})", style="dim", markup=False, highlight=False)
                 self._log_job_end_by_id(manager, status)
 
             # Scenario 2: Transition from RUNNING to non-RUNNING but no current_job_id (fallback by filename)
             elif was_running and not is_running and manager.previous_filename and manager.previous_filename != 'N/A':
-                self.console.print(f"  [dim]DEBUG: Detected job END by filename (was_running={was_running}, status={status})[/]")
+                if MONITOR_VERBOSE:
+                    self.console.print(f"  DEBUG: Detected job END by filename (was_running={was_running}, status={status})", style="dim", markup=False, highlight=False)
                 self._log_job_end(manager, status, manager.previous_filename)
 
             # Scenario 3: Not running, check DB for any orphaned running jobs
@@ -862,152 +1461,111 @@ class SafePrinterMonitor:
                 # Check if there are any unfinished jobs in the database for this printer
                 self._close_orphaned_jobs(manager, status)
             else:
-                self.console.print(f"  [dim]DEBUG: No job event triggered (is_running={is_running}, was_running={was_running}, current_job_id={manager.current_job_id})[/]")
+                if MONITOR_VERBOSE:
+                    self.console.print(f"  DEBUG: No job event triggered (is_running={is_running}, was_running={was_running}, current_job_id={manager.current_job_id})", style="dim", markup=False, highlight=False)
 
         except Exception as e:
             logging.error(f"Failed to log job event for {manager.name}: {e}")
     
-    def _update_job_filaments(self, job_id: int, printer_id: int, status_data: Dict):
+    def _update_job_filaments(self, job_id: int, printer_id: int, status_data: Dict,
+                              active_filament_info: Optional[Dict] = None):
         """Update or create filament records for the current job on each cycle.
 
         This ensures filament data stays current if AMS trays are swapped mid-print.
         Uses UPSERT to update existing records or create new ones.
         """
         if not job_id:
-            self.console.print(f"  [yellow]DEBUG _update_job_filaments: No job_id provided[/]")
+            log.debug("_update_job_filaments: no job_id provided")
             return
 
         try:
-            # Get the currently active filament (vt_tray)
-            active_filament_info = self._extract_filament_info(status_data)
-            active_tray_uuid = active_filament_info.get('tray_uuid') if active_filament_info else None
+            # Get AMS hub data for all loaded filaments
+            ams_hub = status_data.get('ams_hub')
+            loaded_trays = self._loaded_ams_trays(ams_hub) if ams_hub else []
 
             # Get tray_now to identify filament source
             # tray_now values: 0-15 = AMS tray, 254/255 = external spool
             tray_now = status_data.get('tray_now')
 
-            # Get AMS hub data for all loaded filaments
-            ams_hub = status_data.get('ams_hub')
-            self.console.print(f"  [dim]DEBUG _update_job_filaments: job_id={job_id}, ams_hub={'present' if ams_hub else 'None'}, tray_now={tray_now}[/]")
+            # Skip the upserts if nothing about the loaded filaments changed since the
+            # last successful write. Trays are rebuilt from each report, so comparing
+            # the previous FilamentTray objects by value is safe.
+            signature = (job_id, tray_now, status_data.get('vt_tray'), tuple(loaded_trays))
+            if self.filament_signatures.get(printer_id) == signature:
+                return
+
+            profiles = self._prefetch_filament_profiles(status_data, loaded_trays)
+
+            # Get the currently active filament (vt_tray) unless the caller already did
+            if active_filament_info is None:
+                active_filament_info = self._extract_filament_info(status_data)
+            active_tray_uuid = active_filament_info.get('tray_uuid') if active_filament_info else None
+
+            log.debug("_update_job_filaments: job_id=%s, ams_hub=%s, tray_now=%s", job_id, 'present' if ams_hub else 'None', tray_now)
 
             if ams_hub:
-                # Printer has AMS - update all loaded filaments
-                for ams_id in range(4):  # Check up to 4 AMS units
-                    try:
-                        ams = ams_hub[ams_id]
-                        for tray_id in range(4):
-                            tray = ams.get_filament_tray(tray_id)
-                            if tray:
-                                tray_info_idx = getattr(tray, 'tray_info_idx', None)
-                                tray_uuid = getattr(tray, 'tray_uuid', None)
-
-                                # Look up database info
-                                db_info = None
-                                if tray_info_idx and tray_info_idx not in ['N/A', '']:
-                                    try:
-                                        result = self.db_manager.execute_query(
-                                            """
-                                            SELECT name, material_type, vendor, nozzle_temp_min, nozzle_temp_max,
-                                                   bed_temp, density, cost, diameter
-                                            FROM bambu_filament_profiles
-                                            WHERE filament_id = %s
-                                            """,
-                                            (tray_info_idx,),
-                                            fetch=True
-                                        )
-                                        if result and len(result) > 0:
-                                            db_info = {
-                                                'db_name': result[0][0],
-                                                'db_vendor': result[0][2],
-                                                'db_temp_min': result[0][3],
-                                                'db_temp_max': result[0][4],
-                                                'db_bed_temp': result[0][5],
-                                                'db_density': result[0][6],
-                                                'db_cost': result[0][7],
-                                                'db_diameter': result[0][8]
-                                            }
-                                    except Exception:
-                                        pass
-
-                                # Extract tray color
-                                tray_color_raw = getattr(tray, 'tray_color', None)
-                                tray_color = None
-                                if tray_color_raw and tray_color_raw not in ['N/A', ''] and len(tray_color_raw) == 8 and tray_color_raw.endswith('FF'):
-                                    tray_color = tray_color_raw[:-2]
-                                elif tray_color_raw and tray_color_raw not in ['N/A', '']:
-                                    tray_color = tray_color_raw
-
-                                is_primary = (tray_uuid == active_tray_uuid) if active_tray_uuid else False
-
-                                # UPSERT filament record - update if exists, insert if new
-                                self.db_manager.execute_query(
-                                    """
-                                    INSERT INTO printer_job_filaments (
-                                        job_history_id, printer_id, filament_id, tray_uuid,
-                                        ams_id, tray_id, is_primary, was_used,
-                                        filament_name, filament_type, filament_color,
-                                        filament_vendor, temp_min, temp_max, bed_temp,
-                                        weight, cost, density, diameter
-                                    ) VALUES (
-                                        %s, %s, %s, %s, %s, %s, %s, false, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                                    )
-                                    ON CONFLICT (job_history_id, COALESCE(ams_id, -1), COALESCE(tray_id, -1)) DO UPDATE SET
-                                        filament_id = EXCLUDED.filament_id,
-                                        tray_uuid = EXCLUDED.tray_uuid,
-                                        is_primary = EXCLUDED.is_primary,
-                                        filament_name = EXCLUDED.filament_name,
-                                        filament_type = EXCLUDED.filament_type,
-                                        filament_color = EXCLUDED.filament_color,
-                                        filament_vendor = EXCLUDED.filament_vendor,
-                                        temp_min = EXCLUDED.temp_min,
-                                        temp_max = EXCLUDED.temp_max,
-                                        bed_temp = EXCLUDED.bed_temp,
-                                        weight = EXCLUDED.weight,
-                                        cost = EXCLUDED.cost,
-                                        density = EXCLUDED.density,
-                                        diameter = EXCLUDED.diameter;
-                                    """,
-                                    (
-                                        job_id, printer_id,
-                                        tray_info_idx,
-                                        tray_uuid,
-                                        ams_id, tray_id, is_primary,
-                                        db_info.get('db_name') if db_info else None,
-                                        getattr(tray, 'tray_type', None),
-                                        tray_color,
-                                        db_info.get('db_vendor') if db_info else getattr(tray, 'tray_sub_brands', None),
-                                        getattr(tray, 'nozzle_temp_min', None),
-                                        getattr(tray, 'nozzle_temp_max', None),
-                                        getattr(tray, 'bed_temp', None),
-                                        getattr(tray, 'tray_weight', None),
-                                        db_info.get('db_cost') if db_info else None,
-                                        db_info.get('db_density') if db_info else None,
-                                        db_info.get('db_diameter') if db_info else getattr(tray, 'tray_diameter', None)
-                                    )
-                                )
-                                self.console.print(f"  [dim]DEBUG: UPSERT filament AMS {ams_id} Tray {tray_id}[/]")
-
-                    except KeyError:
-                        continue
+                # Printer has AMS - update all loaded filaments in one batch
+                rows = []
+                for ams_id, tray_id, tray in loaded_trays:
+                    tray_info_idx, tray_uuid, filament_columns = _tray_filament_fields(tray, profiles)
+
+                    is_primary = (tray_uuid == active_tray_uuid) if active_tray_uuid else False
+
+                    rows.append((
+                        job_id, printer_id,
+                        tray_info_idx,
+                        tray_uuid,
+                        ams_id, tray_id, is_primary,
+                        *filament_columns
+                    ))
+
+                # UPSERT filament records - update if exists, insert if new
+                if rows:
+                    self.db_manager.execute_many(
+                        """
+                        INSERT INTO printer_job_filaments (
+                            job_history_id, printer_id, filament_id, tray_uuid,
+                            ams_id, tray_id, is_primary, was_used,
+                            filament_name, filament_type, filament_color,
+                            filament_vendor, temp_min, temp_max, bed_temp,
+                            weight, cost, density, diameter
+                        ) VALUES (
+                            %s, %s, %s, %s, %s, %s, %s, false, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+                        )
+                        ON CONFLICT (job_history_id, ams_id, tray_id) WHERE ams_id IS NOT NULL DO UPDATE SET
+                            filament_id = EXCLUDED.filament_id,
+                            tray_uuid = EXCLUDED.tray_uuid,
+                            is_primary = EXCLUDED.is_primary,
+                            filament_name = EXCLUDED.filament_name,
+                            filament_type = EXCLUDED.filament_type,
+                            filament_color = EXCLUDED.filament_color,
+                            filament_vendor = EXCLUDED.filament_vendor,
+                            temp_min = EXCLUDED.temp_min,
+                            temp_max = EXCLUDED.temp_max,
+                            bed_temp = EXCLUDED.bed_temp,
+                            weight = EXCLUDED.weight,
+                            cost = EXCLUDED.cost,
+                            density = EXCLUDED.density,
+                            diameter = EXCLUDED.diameter
+                        """,
+                        rows
+                    )
+                    log.debug("UPSERT %s AMS filament(s)", len(rows))
 
             else:
                 # No AMS hub data - but only update external spool if tray_now confirms it
                 # This prevents logging external spool when AMS is present but ams_hub is temporarily unavailable
-                is_external_spool = False
-                if tray_now is not None:
-                    tray_now_int = int(tray_now) if isinstance(tray_now, str) else tray_now
-                    is_external_spool = tray_now_int in [254, 255]
-                else:
-                    # If tray_now is unknown, assume external spool for printers without AMS
-                    is_external_spool = True
+                # If tray_now is unknown, assume external spool for printers without AMS
+                tray_now_int, _, _ = _decode_tray_now(tray_now)
+                is_external_spool = tray_now_int is None or tray_now_int in _EXTERNAL_SPOOL_TRAYS
 
-                self.console.print(f"  [dim]DEBUG _update_job_filaments: No AMS hub, is_external_spool={is_external_spool}[/]")
+                log.debug("_update_job_filaments: no AMS hub, is_external_spool=%s", is_external_spool)
 
                 if is_external_spool and active_filament_info:
-                    db_info = active_filament_info.get('db_info', {}) or {}
+                    filament_columns = _spool_filament_columns(active_filament_info)
 
                     self.db_manager.execute_query(
-                        """
+                        f"""
                         INSERT INTO printer_job_filaments (
                             job_history_id, printer_id, filament_id, tray_uuid,
                             ams_id, tray_id, is_primary, was_used,
@@ -1017,7 +1575,7 @@ class SafePrinterMonitor:
                         ) VALUES (
                             %s, %s, %s, %s, NULL, NULL, true, true, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
                         )
-                        ON CONFLICT (job_history_id, COALESCE(ams_id, -1), COALESCE(tray_id, -1)) DO UPDATE SET
+                        ON CONFLICT {self.external_spool_conflict} DO UPDATE SET
                             filament_id = EXCLUDED.filament_id,
                             tray_uuid = EXCLUDED.tray_uuid,
                             filament_name = EXCLUDED.filament_name,
@@ -1036,102 +1594,179 @@ class SafePrinterMonitor:
                             job_id, printer_id,
                             active_filament_info.get('tray_info_idx'),
                             active_filament_info.get('tray_uuid'),
-                            db_info.get('db_name'),
-                            active_filament_info.get('type'),
-                            active_filament_info.get('color'),
-                            db_info.get('db_vendor') if db_info else active_filament_info.get('brand'),
-                            active_filament_info.get('temp_min'),
-                            active_filament_info.get('temp_max'),
-                            active_filament_info.get('bed_temp'),
-                            active_filament_info.get('weight'),
-                            db_info.get('db_cost'),
-                            db_info.get('db_density'),
-                            db_info.get('db_diameter') if db_info else active_filament_info.get('diameter')
+                            *filament_columns
                         )
                     )
-                    self.console.print(f"  [dim]DEBUG: UPSERT external spool filament[/]")
+                    log.debug("UPSERT external spool filament")
                 elif not is_external_spool:
-                    self.console.print(f"  [yellow]DEBUG: tray_now={tray_now} indicates AMS tray but no AMS hub data - skipping external spool update[/]")
+                    log.debug("tray_now=%s indicates AMS tray but no AMS hub data - skipping external spool update", tray_now)
                 else:
-                    self.console.print(f"  [yellow]DEBUG _update_job_filaments: No active_filament_info for external spool[/]")
+                    log.debug("_update_job_filaments: no active_filament_info for external spool")
+
+            self.filament_signatures[printer_id] = signature
 
         except Exception as e:
             logging.error(f"Failed to update filaments for job {job_id}: {e}")
-            self.console.print(f"  [red]DEBUG _update_job_filaments exception: {e}[/]")
 
-    def _update_filament_usage(self, job_id: int, status_data: Dict):
-        """Update was_used flags during printing as tray_now changes."""
+    def _update_filament_usage(self, job_id: int, status_data: Dict) -> bool:
+        """Update was_used flags during printing as tray_now changes; False if the update failed."""
         try:
-            self.console.print(f"  [dim]DEBUG: _update_filament_usage called for job {job_id}[/]")
+            log.debug("_update_filament_usage called for job %s", job_id)
 
             # Get current tray_now
             tray_now = status_data.get('tray_now')
-            self.console.print(f"  [dim]DEBUG: tray_now from status_data = {tray_now} (type: {type(tray_now)})[/]")
+            log.debug("tray_now from status_data = %s (type: %s)", tray_now, type(tray_now))
 
-            if tray_now is None:
-                self.console.print(f"  [yellow]DEBUG: tray_now is None, cannot update filament usage[/]")
-                logging.debug(f"Job {job_id}: tray_now is None")
-                return
-
-            tray_now_int = int(tray_now) if isinstance(tray_now, str) else tray_now
-            self.console.print(f"  [dim]DEBUG: tray_now_int = {tray_now_int}[/]")
-            logging.debug(f"Job {job_id}: tray_now = {tray_now_int}")
+            tray_now_int, active_ams_id, active_tray_id = _decode_tray_now(tray_now)
+            if tray_now_int is None:
+                log.debug("Job %s: tray_now is None", job_id)
+                return True
 
-            # Decode tray_now to get active AMS and tray
-            if tray_now_int < 16:  # Valid AMS tray
-                active_ams_id = tray_now_int // 4
-                active_tray_id = tray_now_int % 4
+            log.debug("Job %s: tray_now = %s", job_id, tray_now_int)
 
-                self.console.print(f"  [cyan]DEBUG: Decoded tray_now={tray_now_int} -> AMS {active_ams_id}, Tray {active_tray_id}[/]")
-                logging.info(f"Job {job_id}: Marking AMS {active_ams_id}, Tray {active_tray_id} as used (tray_now={tray_now_int})")
+            if active_ams_id is not None:  # Valid AMS tray
+                log.info("Job %s: Marking AMS %s, Tray %s as used (tray_now=%s)", job_id, active_ams_id, active_tray_id, tray_now_int)
 
-                # First, check what filaments exist for this job
-                existing_filaments = self.db_manager.execute_query(
-                    """
-                    SELECT ams_id, tray_id, was_used, filament_name, filament_color
-                    FROM printer_job_filaments
-                    WHERE job_history_id = %s
-                    ORDER BY ams_id, tray_id;
-                    """,
-                    (job_id,),
-                    fetch=True
-                )
-                self.console.print(f"  [dim]DEBUG: Existing filaments for job {job_id}: {existing_filaments}[/]")
+                if log.isEnabledFor(logging.DEBUG):
+                    existing_filaments = self.db_manager.execute_query(
+                        """
+                        SELECT ams_id, tray_id, was_used, filament_name, filament_color
+                        FROM printer_job_filaments
+                        WHERE job_history_id = %s
+                        ORDER BY ams_id, tray_id;
+                        """,
+                        (job_id,),
+                        fetch=True
+                    )
+                    log.debug("Existing filaments for job %s: %s", job_id, existing_filaments)
 
                 # Update was_used flag for this filament
-                self.console.print(f"  [dim]DEBUG: Running UPDATE query for job_id={job_id}, ams_id={active_ams_id}, tray_id={active_tray_id}[/]")
-                rows_affected = self.db_manager.execute_query(
+                log.debug("Running UPDATE query for job_id=%s, ams_id=%s, tray_id=%s", job_id, active_ams_id, active_tray_id)
+                rows_affected = self.db_manager.execute_prepared(
+                    "filament_used_stmt",
                     """
                     UPDATE printer_job_filaments
                     SET was_used = true
-                    WHERE job_history_id = %s
-                      AND ams_id = %s
-                      AND tray_id = %s
+                    WHERE job_history_id = $1
+                      AND ams_id = $2
+                      AND tray_id = $3
                       AND was_used = false
-                    RETURNING ams_id, tray_id;
+                    RETURNING ams_id, tray_id
                     """,
                     (job_id, active_ams_id, active_tray_id),
                     fetch=True
                 )
 
-                self.console.print(f"  [dim]DEBUG: UPDATE query returned: {rows_affected}[/]")
+                log.debug("UPDATE query returned: %s", rows_affected)
 
                 if rows_affected:
-                    logging.info(f"Job {job_id}: Updated {len(rows_affected)} filament(s) to was_used=true")
+                    log.info("Job %s: Updated %s filament(s) to was_used=true", job_id, len(rows_affected))
                     # Also show in console for visibility
-                    self.console.print(f"  [green][OK] Filament usage detected:[/] AMS {active_ams_id}, Tray {active_tray_id} now marked as USED")
+                    self.console.print(f"  [OK] Filament usage detected: AMS {active_ams_id}, Tray {active_tray_id} now marked as USED",
+                                       style="green", markup=False, highlight=False)
                 else:
-                    self.console.print(f"  [yellow]DEBUG: No rows updated (already marked as used, or filament not found)[/]")
-            elif tray_now_int in [254, 255]:
-                self.console.print(f"  [dim]DEBUG: tray_now={tray_now_int} is external spool (already marked as used at job start)[/]")
-                logging.debug(f"Job {job_id}: tray_now={tray_now_int} is external spool")
+                    log.debug("No rows updated (already marked as used, or filament not found)")
+            elif tray_now_int in _EXTERNAL_SPOOL_TRAYS:
+                log.debug("Job %s: tray_now=%s is external spool", job_id, tray_now_int)
             else:
-                self.console.print(f"  [yellow]DEBUG: tray_now={tray_now_int} is unexpected value[/]")
+                log.debug("tray_now=%s is unexpected value", tray_now_int)
             # For external spool (255/254), it's already marked as used at job start
+            return True
 
         except Exception as e:
-            self.console.print(f"  [red]DEBUG: Exception in _update_filament_usage: {e}[/]")
             logging.error(f"Failed to update filament usage for job {job_id}: {e}")
+            return False
+
+    def _get_filament_profile(self, filament_id: Optional[str]) -> Optional[Dict]:
+        """Look up a single filament profile (see _get_filament_profiles)."""
+        return self._get_filament_profiles([filament_id]).get(filament_id)
+
+    def _get_filament_profiles(self, filament_ids) -> Dict[str, Optional[Dict]]:
+        """Look up filament profiles by filament_id, caching hits and misses for FILAMENT_PROFILE_CACHE_TTL.
+
+        All IDs missing from the cache are fetched with a single ANY(...) query. The
+        cache is an LRU bounded to FILAMENT_PROFILE_CACHE_SIZE entries.
+        """
+        cache = self.filament_profile_cache
+        now = time.monotonic()
+        profiles = {}
+        missing = set()
+        for filament_id in filament_ids:
+            if filament_id in _INVALID_SENTINELS or filament_id in profiles:
+                continue
+            cached = cache.get(filament_id)
+            if cached and now - cached[0] < FILAMENT_PROFILE_CACHE_TTL:
+                cache.move_to_end(filament_id)
+                profiles[filament_id] = cached[1]
+            else:
+                missing.add(filament_id)
+
+        if not missing:
+            return profiles
+
+        try:
+            result = self.db_manager.execute_prepared(
+                "filament_profile_lookup",
+                """
+                SELECT filament_id, name AS db_name, material_type AS db_material_type,
+                       vendor AS db_vendor, nozzle_temp_min AS db_temp_min,
+                       nozzle_temp_max AS db_temp_max, bed_temp AS db_bed_temp,
+                       density AS db_density, cost AS db_cost, diameter AS db_diameter,
+                       flow_ratio AS db_flow_ratio
+                FROM bambu_filament_profiles
+                WHERE filament_id = ANY($1)
+                """,
+                (list(missing),),
+                fetch=True,
+                cursor_factory=psycopg2.extras.RealDictCursor
+            )
+        except Exception:
+            # Don't cache failed lookups so the next cycle retries
+            return profiles
+
+        # Rows come back as dicts already keyed by the db_* aliases
+        fetched = {row.pop('filament_id'): row for row in result or []}
+
+        # Unknown filament IDs are cached as None too, so they are not re-queried every cycle
+        for filament_id in missing:
+            db_info = fetched.get(filament_id)
+            cache[filament_id] = (now, db_info)
+            cache.move_to_end(filament_id)
+            profiles[filament_id] = db_info
+        while len(cache) > FILAMENT_PROFILE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return profiles
+
+    def _loaded_ams_trays(self, ams_hub) -> List[Tuple[int, int, object]]:
+        """Return (ams_id, tray_id, tray) for every loaded AMS tray."""
+        loaded_trays = []
+        for ams_id, ams in sorted(ams_hub.items()):
+            if ams_id >= 4:  # tray_now only addresses 4 AMS units
+                continue
+            for tray_id, tray in sorted(ams.filament_trays.items()):
+                if tray_id < 4 and tray:
+                    loaded_trays.append((ams_id, tray_id, tray))
+        return loaded_trays
+
+    def _status_filament_ids(self, status_data: Dict, loaded_trays) -> List[Optional[str]]:
+        """Return the filament IDs of the external spool and all loaded AMS trays."""
+        vt_tray = status_data.get('vt_tray')
+        filament_ids = [getattr(vt_tray, 'tray_info_idx', None)] if vt_tray else []
+        filament_ids.extend(getattr(tray, 'tray_info_idx', None) for _, _, tray in loaded_trays)
+        return filament_ids
+
+    def _prefetch_filament_profiles(self, status_data: Dict, loaded_trays) -> Dict[str, Optional[Dict]]:
+        """Fetch the profiles for the external spool and all AMS trays in one query."""
+        return self._get_filament_profiles(self._status_filament_ids(status_data, loaded_trays))
+
+    def _prefetch_cycle_filament_profiles(self, statuses: List[Dict]):
+        """Warm the profile cache for every polled printer with a single query per cycle."""
+        filament_ids = []
+        for status_data in statuses:
+            ams_hub = status_data.get('ams_hub')
+            loaded_trays = self._loaded_ams_trays(ams_hub) if ams_hub else []
+            filament_ids.extend(self._status_filament_ids(status_data, loaded_trays))
+        self._get_filament_profiles(filament_ids)
 
     def _extract_filament_info(self, status_data: Dict) -> Optional[Dict]:
         """Extract and process filament information from status data."""
@@ -1140,65 +1775,32 @@ class SafePrinterMonitor:
             if not vt_tray:
                 return None
 
-            # Extract filament information
-            tray_type = getattr(vt_tray, 'tray_type', None)
+            # Extract filament information; unset fields ('N/A', '') become None
+            tray_type = _clean_value(getattr(vt_tray, 'tray_type', None))
             tray_color_raw = getattr(vt_tray, 'tray_color', None)
 
             # Remove FF suffix if present (8-char hex -> 6-char hex)
-            tray_color = None
-            if tray_color_raw and tray_color_raw not in ['N/A', ''] and len(tray_color_raw) == 8 and tray_color_raw.endswith('FF'):
-                tray_color = tray_color_raw[:-2]
-            elif tray_color_raw and tray_color_raw not in ['N/A', '']:
-                tray_color = tray_color_raw
-
-            tray_weight = getattr(vt_tray, 'tray_weight', None)
-            tray_brand = getattr(vt_tray, 'tray_sub_brands', None)
-            tray_info_idx = getattr(vt_tray, 'tray_info_idx', None)
-            tray_diameter = getattr(vt_tray, 'tray_diameter', None)
-            tray_uuid = getattr(vt_tray, 'tray_uuid', None)
-            bed_temp = getattr(vt_tray, 'bed_temp', None)
+            tray_color = _normalize_color(tray_color_raw)
+
+            tray_weight = _clean_value(getattr(vt_tray, 'tray_weight', None))
+            tray_brand = _clean_value(getattr(vt_tray, 'tray_sub_brands', None))
+            tray_info_idx = _clean_value(getattr(vt_tray, 'tray_info_idx', None))
+            tray_diameter = _clean_value(getattr(vt_tray, 'tray_diameter', None))
+            tray_uuid = _clean_value(getattr(vt_tray, 'tray_uuid', None))
 
             # Convert temperature values
             temp_min = 0
             temp_max = 0
             bed_temp_int = 0
             try:
-                temp_min_raw = getattr(vt_tray, 'nozzle_temp_min', 0)
-                temp_max_raw = getattr(vt_tray, 'nozzle_temp_max', 0)
-                temp_min = int(temp_min_raw) if temp_min_raw not in ['N/A', '', None] else 0
-                temp_max = int(temp_max_raw) if temp_max_raw not in ['N/A', '', None] else 0
-                bed_temp_int = int(bed_temp) if bed_temp not in ['N/A', '', None] else 0
+                temp_min = int(_clean_value(getattr(vt_tray, 'nozzle_temp_min', 0)) or 0)
+                temp_max = int(_clean_value(getattr(vt_tray, 'nozzle_temp_max', 0)) or 0)
+                bed_temp_int = int(_clean_value(getattr(vt_tray, 'bed_temp', None)) or 0)
             except (ValueError, TypeError):
                 pass
 
             # Look up filament information from database if available
-            db_info = None
-            if tray_info_idx and tray_info_idx not in ['N/A', '']:
-                try:
-                    result = self.db_manager.execute_query(
-                        """
-                        SELECT name, material_type, vendor, nozzle_temp_min, nozzle_temp_max,
-                               bed_temp, density, cost, diameter
-                        FROM bambu_filament_profiles
-                        WHERE filament_id = %s
-                        """,
-                        (tray_info_idx,),
-                        fetch=True
-                    )
-                    if result and len(result) > 0:
-                        db_info = {
-                            'db_name': result[0][0],
-                            'db_material_type': result[0][1],
-                            'db_vendor': result[0][2],
-                            'db_temp_min': result[0][3],
-                            'db_temp_max': result[0][4],
-                            'db_bed_temp': result[0][5],
-                            'db_density': result[0][6],
-                            'db_cost': result[0][7],
-                            'db_diameter': result[0][8]
-                        }
-                except Exception:
-                    pass
+            db_info = self._get_filament_profile(tray_info_idx)
 
             # Only create filament info if we have meaningful data
             # We now accept any filament with a valid type and either:
@@ -1209,10 +1811,10 @@ class SafePrinterMonitor:
             has_meaningful_data = (
                 (temp_min > 0 or temp_max > 0) or
                 db_info or
-                (tray_info_idx and tray_info_idx not in ['N/A', '', 'GFL99']) or  # GFL99 is often placeholder
-                (tray_color and tray_color not in ['00000000'])  # Only reject fully transparent
+                tray_info_idx not in _PLACEHOLDER_FILAMENT_IDS or
+                tray_color not in _INVALID_COLORS  # Only reject fully transparent
             )
-            if tray_type and tray_type not in ['N/A', ''] and has_meaningful_data:
+            if tray_type and has_meaningful_data:
                 return {
                     'type': tray_type,
                     'color': tray_color,
@@ -1233,17 +1835,29 @@ class SafePrinterMonitor:
             logging.error(f"Error extracting filament info: {e}")
             return None
 
-    def _log_job_filaments(self, job_id: int, printer_id: int, status_data: Dict):
+    def _log_job_filaments(self, job_id: int, printer_id: int, status_data: Dict,
+                           active_filament_info: Optional[Dict] = None):
         """Save ALL filament information for this print job (supports multi-color prints)."""
-        if not job_id:
+        if not job_id or job_id in self.filaments_logged:
             return
 
         try:
+            # Get AMS hub data for all loaded filaments
+            ams_hub = status_data.get('ams_hub')
+
+            # Get the currently active filament (vt_tray) unless the caller already did
+            if active_filament_info is None:
+                active_filament_info = self._extract_filament_info(status_data)
+
+            # Nothing to record without AMS trays or an external spool
+            if not ams_hub and not active_filament_info:
+                self.console.print("  [yellow]No filament data captured[/]")
+                return
+
             filaments_captured = []
             filaments_used = []
-
-            # Get the currently active filament (vt_tray)
-            active_filament_info = self._extract_filament_info(status_data)
+            loaded_trays = self._loaded_ams_trays(ams_hub) if ams_hub else []
+            profiles = self._prefetch_filament_profiles(status_data, loaded_trays)
             active_tray_uuid = active_filament_info.get('tray_uuid') if active_filament_info else None
 
             # Get tray_now to identify which filament is actually being used
@@ -1254,234 +1868,136 @@ class SafePrinterMonitor:
             tray_now = status_data.get('tray_now')
 
             # DEBUG: Show tray_now at job start
-            self.console.print(f"  [dim]DEBUG _log_job_filaments: tray_now = {tray_now} (type: {type(tray_now)})[/]")
+            log.debug("_log_job_filaments: tray_now = %s (type: %s)", tray_now, type(tray_now))
 
-            active_ams_id = None
-            active_tray_id = None
-
-            if tray_now is not None:
-                tray_now_int = int(tray_now) if isinstance(tray_now, str) else tray_now
-                if tray_now_int < 16:  # Valid AMS tray (0-15 covers 4 AMS units * 4 trays)
-                    active_ams_id = tray_now_int // 4
-                    active_tray_id = tray_now_int % 4
-                # else: external spool (255 or 254)
-
-            # Get AMS hub data for all loaded filaments
-            ams_hub = status_data.get('ams_hub')
+            tray_now_int, active_ams_id, active_tray_id = _decode_tray_now(tray_now)
 
+            rows = []
             if ams_hub:
                 # Printer has AMS - capture all loaded filaments
-                for ams_id in range(4):  # Check up to 4 AMS units
-                    try:
-                        ams = ams_hub[ams_id]
-                        # Get all 4 tray positions in this AMS
-                        for tray_id in range(4):
-                            tray = ams.get_filament_tray(tray_id)
-                            if tray:
-                                tray_info_idx = getattr(tray, 'tray_info_idx', None)
-                                tray_uuid = getattr(tray, 'tray_uuid', None)
-
-                                # Look up database info
-                                db_info = None
-                                if tray_info_idx and tray_info_idx not in ['N/A', '']:
-                                    try:
-                                        result = self.db_manager.execute_query(
-                                            """
-                                            SELECT name, material_type, vendor, nozzle_temp_min, nozzle_temp_max,
-                                                   bed_temp, density, cost, diameter
-                                            FROM bambu_filament_profiles
-                                            WHERE filament_id = %s
-                                            """,
-                                            (tray_info_idx,),
-                                            fetch=True
-                                        )
-                                        if result and len(result) > 0:
-                                            db_info = {
-                                                'db_name': result[0][0],
-                                                'db_vendor': result[0][2],
-                                                'db_temp_min': result[0][3],
-                                                'db_temp_max': result[0][4],
-                                                'db_bed_temp': result[0][5],
-                                                'db_density': result[0][6],
-                                                'db_cost': result[0][7],
-                                                'db_diameter': result[0][8]
-                                            }
-                                    except Exception:
-                                        pass
-
-                                # Extract tray color
-                                tray_color_raw = getattr(tray, 'tray_color', None)
-                                tray_color = None
-                                if tray_color_raw and tray_color_raw not in ['N/A', ''] and len(tray_color_raw) == 8 and tray_color_raw.endswith('FF'):
-                                    tray_color = tray_color_raw[:-2]
-                                elif tray_color_raw and tray_color_raw not in ['N/A', '']:
-                                    tray_color = tray_color_raw
-
-                                # Check if this is the primary (active) filament
-                                is_primary = (tray_uuid == active_tray_uuid) if active_tray_uuid else False
-
-                                # Check if this filament was actually used (matches tray_now)
-                                was_used = (ams_id == active_ams_id and tray_id == active_tray_id)
-
-                                # DEBUG: Show what was_used is being set to
-                                self.console.print(f"  [dim]DEBUG: AMS {ams_id} Tray {tray_id}: was_used={was_used} (active_ams_id={active_ams_id}, active_tray_id={active_tray_id})[/]")
-
-                                # Insert filament record
-                                self.db_manager.execute_query(
-                                    """
-                                    INSERT INTO printer_job_filaments (
-                                        job_history_id, printer_id, filament_id, tray_uuid,
-                                        ams_id, tray_id, is_primary, was_used,
-                                        filament_name, filament_type, filament_color,
-                                        filament_vendor, temp_min, temp_max, bed_temp,
-                                        weight, cost, density, diameter
-                                    ) VALUES (
-                                        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                                    )
-                                    ON CONFLICT (job_history_id, COALESCE(ams_id, -1), COALESCE(tray_id, -1)) DO NOTHING;
-                                    """,
-                                    (
-                                        job_id, printer_id,
-                                        tray_info_idx,
-                                        tray_uuid,
-                                        ams_id, tray_id, is_primary, was_used,
-                                        db_info.get('db_name') if db_info else None,
-                                        getattr(tray, 'tray_type', None),
-                                        tray_color,
-                                        db_info.get('db_vendor') if db_info else getattr(tray, 'tray_sub_brands', None),
-                                        getattr(tray, 'nozzle_temp_min', None),
-                                        getattr(tray, 'nozzle_temp_max', None),
-                                        getattr(tray, 'bed_temp', None),
-                                        getattr(tray, 'tray_weight', None),
-                                        db_info.get('db_cost') if db_info else None,
-                                        db_info.get('db_density') if db_info else None,
-                                        db_info.get('db_diameter') if db_info else getattr(tray, 'tray_diameter', None)
-                                    )
-                                )
-
-                                filament_type = db_info.get('db_name') if db_info and db_info.get('db_name') else getattr(tray, 'tray_type', 'Unknown')
-                                filament_desc = f"{filament_type} ({tray_color or 'no color'})"
-                                filaments_captured.append(filament_desc)
-                                if was_used:
-                                    filaments_used.append(filament_desc)
-
-                    except KeyError:
-                        # AMS unit doesn't exist
-                        continue
+                for ams_id, tray_id, tray in loaded_trays:
+                    tray_info_idx, tray_uuid, filament_columns = _tray_filament_fields(tray, profiles)
+
+                    # Check if this is the primary (active) filament
+                    is_primary = (tray_uuid == active_tray_uuid) if active_tray_uuid else False
+
+                    # Check if this filament was actually used (matches tray_now)
+                    was_used = (ams_id == active_ams_id and tray_id == active_tray_id)
+
+                    # DEBUG: Show what was_used is being set to
+                    log.debug("AMS %s Tray %s: was_used=%s (active_ams_id=%s, active_tray_id=%s)", ams_id, tray_id, was_used, active_ams_id, active_tray_id)
+
+                    rows.append((
+                        job_id, printer_id,
+                        tray_info_idx,
+                        tray_uuid,
+                        ams_id, tray_id, is_primary, was_used,
+                        *filament_columns
+                    ))
+
+                    filament_name, filament_type, tray_color = filament_columns[:3]
+                    filament_desc = f"{filament_name or filament_type or 'Unknown'} ({tray_color or 'no color'})"
+                    filaments_captured.append(filament_desc)
+                    if was_used:
+                        filaments_used.append(filament_desc)
 
             else:
                 # No AMS hub data - but only log external spool if tray_now confirms it
                 # This prevents logging external spool when AMS is present but ams_hub is temporarily unavailable
                 # tray_now values: 0-15 = AMS tray, 254/255 = external spool
-                is_external_spool = False
-                if tray_now is not None:
-                    tray_now_int = int(tray_now) if isinstance(tray_now, str) else tray_now
-                    is_external_spool = tray_now_int in [254, 255]
-                else:
-                    # If tray_now is unknown, assume external spool for printers without AMS
-                    is_external_spool = True
+                # If tray_now is unknown, assume external spool for printers without AMS
+                tray_now_int, _, _ = _decode_tray_now(tray_now)
+                is_external_spool = tray_now_int is None or tray_now_int in _EXTERNAL_SPOOL_TRAYS
 
                 if is_external_spool and active_filament_info:
-                    db_info = active_filament_info.get('db_info', {}) or {}
+                    filament_columns = _spool_filament_columns(active_filament_info)
 
                     # External spool is always considered "used" if it's active
                     was_used = True
 
-                    self.db_manager.execute_query(
-                        """
-                        INSERT INTO printer_job_filaments (
-                            job_history_id, printer_id, filament_id, tray_uuid,
-                            ams_id, tray_id, is_primary, was_used,
-                            filament_name, filament_type, filament_color,
-                            filament_vendor, temp_min, temp_max, bed_temp,
-                            weight, cost, density, diameter
-                        ) VALUES (
-                            %s, %s, %s, %s, NULL, NULL, true, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-                        )
-                        ON CONFLICT (job_history_id, COALESCE(ams_id, -1), COALESCE(tray_id, -1)) DO NOTHING;
-                        """,
-                        (
-                            job_id, printer_id,
-                            active_filament_info.get('tray_info_idx'),
-                            active_filament_info.get('tray_uuid'),
-                            was_used,
-                            db_info.get('db_name'),
-                            active_filament_info.get('type'),
-                            active_filament_info.get('color'),
-                            db_info.get('db_vendor') if db_info else active_filament_info.get('brand'),
-                            active_filament_info.get('temp_min'),
-                            active_filament_info.get('temp_max'),
-                            active_filament_info.get('bed_temp'),
-                            active_filament_info.get('weight'),
-                            db_info.get('db_cost'),
-                            db_info.get('db_density'),
-                            db_info.get('db_diameter') if db_info else active_filament_info.get('diameter')
-                        )
-                    )
+                    rows.append((
+                        job_id, printer_id,
+                        active_filament_info.get('tray_info_idx'),
+                        active_filament_info.get('tray_uuid'),
+                        None, None, True, was_used,
+                        *filament_columns
+                    ))
 
-                    filament_type = db_info.get('db_name') if db_info and db_info.get('db_name') else active_filament_info.get('type', 'Unknown')
+                    filament_type = filament_columns[0] or active_filament_info.get('type', 'Unknown')
                     filament_desc = f"{filament_type} ({active_filament_info.get('color', 'no color')})"
                     filaments_captured.append(filament_desc)
                     filaments_used.append(filament_desc)
                 elif not is_external_spool:
-                    self.console.print(f"  [yellow]DEBUG: tray_now={tray_now} indicates AMS tray but no AMS hub data - skipping external spool logging[/]")
+                    log.debug("tray_now=%s indicates AMS tray but no AMS hub data - skipping external spool logging", tray_now)
+
+            # Insert every filament record in one statement; AMS and external spool rows
+            # use different partial unique indexes, so no single conflict target fits both
+            if rows:
+                self.db_manager.execute_values(
+                    """
+                    INSERT INTO printer_job_filaments (
+                        job_history_id, printer_id, filament_id, tray_uuid,
+                        ams_id, tray_id, is_primary, was_used,
+                        filament_name, filament_type, filament_color,
+                        filament_vendor, temp_min, temp_max, bed_temp,
+                        weight, cost, density, diameter
+                    ) VALUES %s
+                    ON CONFLICT DO NOTHING;
+                    """,
+                    rows,
+                    page_size=16
+                )
+                self.filaments_logged.add(job_id)
 
             # Display captured filaments with detailed info
             if filaments_captured:
-                # Show tray_now debug info
-                tray_now_display = "None"
-                if tray_now is not None:
-                    tray_now_int = int(tray_now) if isinstance(tray_now, str) else tray_now
-                    if tray_now_int < 16:
-                        tray_now_display = f"{tray_now_int} (AMS {active_ams_id}, Tray {active_tray_id})"
-                    else:
-                        tray_now_display = f"{tray_now_int} (External)"
-
-                self.console.print(f"  [dim]tray_now: {tray_now_display}[/]")
-                self.console.print(f"  [green]Filaments loaded ({len(filaments_captured)}):[/] {', '.join(filaments_captured)}")
-                if filaments_used:
-                    self.console.print(f"  [cyan]Filaments actively used ({len(filaments_used)}):[/] {', '.join(filaments_used)}")
-                else:
-                    self.console.print(f"  [yellow]No filaments marked as used yet (tray_now may not be set)[/]")
+                self._print_filament_summary(filaments_captured, filaments_used, tray_now_int, active_ams_id, active_tray_id)
             else:
                 self.console.print(f"  [yellow]No filament data captured[/]")
 
         except Exception as e:
             logging.error(f"Failed to log filaments for job {job_id}: {e}")
 
+    def _print_filament_summary(self, filaments_captured: List[str], filaments_used: List[str],
+                                tray_now_int: Optional[int], active_ams_id: Optional[int], active_tray_id: Optional[int]):
+        """Print the filaments recorded for a job start."""
+        if log.isEnabledFor(logging.DEBUG):
+            tray_now_display = "None"
+            if active_ams_id is not None:
+                tray_now_display = f"{tray_now_int} (AMS {active_ams_id}, Tray {active_tray_id})"
+            elif tray_now_int is not None:
+                tray_now_display = f"{tray_now_int} (External)"
+            log.debug("tray_now: %s", tray_now_display)
+
+        self.console.print(f"  [green]Filaments loaded ({len(filaments_captured)}):[/] {', '.join(filaments_captured)}")
+        if filaments_used:
+            self.console.print(f"  [cyan]Filaments actively used ({len(filaments_used)}):[/] {', '.join(filaments_used)}")
+        else:
+            self.console.print(f"  [yellow]No filaments marked as used yet (tray_now may not be set)[/]")
+
     def _log_job_start(self, manager, status, gcode_file, remaining_time_min, percentage, status_data: Dict):
         """Log job start event."""
         # Get Bambu's job_id from MQTT data - this is the authoritative unique identifier for cloud prints
         # For local prints (subtask_id = "0"), bambu_job_id will be None
         bambu_job_id = status_data.get('bambu_job_id')
 
-        existing = None
-
-        # For cloud prints (with bambu_job_id), check for existing job by bambu_job_id
+        # For cloud prints (with bambu_job_id), reopen an existing job by bambu_job_id (pause/resume case):
+        # set the status to RUNNING and clear end_time in the same statement that finds it
         if bambu_job_id:
             existing = self.db_manager.execute_query(
                 """
-                SELECT id FROM printer_job_history
-                WHERE bambu_job_id = %s;
+                UPDATE printer_job_history
+                SET status = %s, end_time = NULL
+                WHERE id = (SELECT id FROM printer_job_history WHERE bambu_job_id = %s LIMIT 1)
+                RETURNING id;
                 """,
-                (bambu_job_id,),
+                (status, bambu_job_id),
                 fetch=True
             )
 
-            if existing and len(existing) > 0:
-                # Job already exists with bambu_job_id - just load it (pause/resume case)
+            if existing:
                 manager.current_job_id = existing[0][0]
                 self.console.print(f"  [yellow]Job RESUMED (cloud):[/] {gcode_file} (ID: {manager.current_job_id}, Bambu: {bambu_job_id})")
-
-                # Update status to RUNNING and clear end_time (job is running again)
-                self.db_manager.execute_query(
-                    """
-                    UPDATE printer_job_history
-                    SET status = %s, end_time = NULL
-                    WHERE id = %s;
-                    """,
-                    (status, manager.current_job_id)
-                )
                 return
 
         # Check for existing unfinished job on this printer with same filename (handles local prints and legacy records)
@@ -1531,16 +2047,17 @@ class SafePrinterMonitor:
                     )
 
                 # Backfill filaments if needed
-                filament_count = self.db_manager.execute_query(
+                if manager.current_job_id in self.filaments_logged:
+                    return
+                has_filaments = self.db_manager.execute_query(
                     """
-                    SELECT COUNT(*) FROM printer_job_filaments
-                    WHERE job_history_id = %s;
+                    SELECT EXISTS (SELECT 1 FROM printer_job_filaments WHERE job_history_id = %s);
                     """,
                     (manager.current_job_id,),
                     fetch=True
                 )
 
-                if filament_count and filament_count[0][0] == 0:
+                if has_filaments and not has_filaments[0][0]:
                     self._log_job_filaments(manager.current_job_id, manager.printer_id, status_data)
 
                 return
@@ -1602,33 +2119,34 @@ class SafePrinterMonitor:
                     )
 
                 # Backfill filaments if needed
-                filament_count = self.db_manager.execute_query(
+                if manager.current_job_id in self.filaments_logged:
+                    return
+                has_filaments = self.db_manager.execute_query(
                     """
-                    SELECT COUNT(*) FROM printer_job_filaments
-                    WHERE job_history_id = %s;
+                    SELECT EXISTS (SELECT 1 FROM printer_job_filaments WHERE job_history_id = %s);
                     """,
                     (manager.current_job_id,),
                     fetch=True
                 )
 
-                if filament_count and filament_count[0][0] == 0:
+                if has_filaments and not has_filaments[0][0]:
                     self._log_job_filaments(manager.current_job_id, manager.printer_id, status_data)
 
                 return
 
         # New job - calculate estimated start time based on progress
-        interval_string = None
+        total_print_time = None
         elapsed_seconds = 0
 
-        # Get current local time in Python
-        now = datetime.datetime.now()
+        # Current local time, taken once for this monitoring cycle
+        now = self.cycle_now
 
-        if isinstance(remaining_time_min, (int, float)) and remaining_time_min >= 0:
+        if remaining_time_min is not None and remaining_time_min >= 0:
             remaining_seconds = int(remaining_time_min * 60)
-            if isinstance(percentage, (int, float)) and 0 < percentage < 100:
+            if percentage is not None and 0 < percentage < 100:
                 try:
                     estimated_total_seconds = int(float(remaining_seconds) * 100.0 / (100.0 - float(percentage)))
-                    interval_string = f"{estimated_total_seconds} seconds"
+                    total_print_time = datetime.timedelta(seconds=estimated_total_seconds)
                     elapsed_seconds = int((float(percentage) * float(remaining_seconds)) / (100.0 - float(percentage)))
                     # Sanity check: elapsed time should be positive and not exceed total estimated time
                     if elapsed_seconds < 0 or elapsed_seconds >= estimated_total_seconds:
@@ -1636,22 +2154,23 @@ class SafePrinterMonitor:
                         elapsed_seconds = 0
                 except Exception as calc_error:
                     logging.warning(f"Error calculating start time: {calc_error}")
-                    interval_string = f"{remaining_seconds} seconds"
+                    total_print_time = datetime.timedelta(seconds=remaining_seconds)
                     elapsed_seconds = 0
             else:
-                interval_string = f"{remaining_seconds} seconds"
+                total_print_time = datetime.timedelta(seconds=remaining_seconds)
 
         # Calculate start time in Python to avoid timezone issues
         start_time = now - datetime.timedelta(seconds=elapsed_seconds)
 
         # Insert job start with bambu_job_id (may be None for local prints)
         job_type = "cloud" if bambu_job_id else "local"
-        result = self.db_manager.execute_query(
+        result = self.db_manager.execute_prepared(
+            "job_start_stmt",
             """
             INSERT INTO printer_job_history (printer_id, filename, start_time, status, total_print_time, bambu_job_id)
-            VALUES (%s, %s, %s, %s, %s::interval, %s) RETURNING id;
+            VALUES ($1, $2, $3, $4, $5, $6) RETURNING id
             """,
-            (manager.printer_id, gcode_file, start_time, status, interval_string, bambu_job_id),
+            (manager.printer_id, gcode_file, start_time, status, total_print_time, bambu_job_id),
             fetch=True
         )
 
@@ -1665,13 +2184,14 @@ class SafePrinterMonitor:
     def _log_job_end(self, manager, status, filename):
         """Log job end event by filename."""
         # Use Python datetime for timezone consistency
-        end_time = datetime.datetime.now()
+        end_time = self.cycle_now
 
-        rows_updated = self.db_manager.execute_query(
+        rows_updated = self.db_manager.execute_prepared(
+            "job_end_stmt",
             """
             UPDATE printer_job_history
-            SET end_time = %s, status = %s
-            WHERE printer_id = %s AND filename = %s AND end_time IS NULL;
+            SET end_time = $1, status = $2
+            WHERE printer_id = $3 AND filename = $4 AND end_time IS NULL
             """,
             (end_time, status, manager.printer_id, filename)
         )
@@ -1680,85 +2200,93 @@ class SafePrinterMonitor:
             self.console.print(f"  [blue]Job END:[/] {filename} - {status}")
             if status == "FINISH":
                 self.console.print(f"  [green]Job completed successfully[/]")
+            self.filaments_logged.discard(manager.current_job_id)
             manager.current_job_id = None
+            manager.last_usage_key = None
+            self.filament_summary_stale = True
 
     def _log_job_end_by_id(self, manager, status):
         """Log job end event using current_job_id directly (more reliable than filename matching)."""
         if not manager.current_job_id:
             return
 
-        end_time = datetime.datetime.now()
+        end_time = self.cycle_now
 
-        # Get job info before updating
-        job_info = self.db_manager.execute_query(
+        # Close the job in one round trip; no row back means it was already ended
+        ended_job = self.db_manager.execute_prepared(
+            "job_end_by_id_stmt",
             """
-            SELECT filename, end_time FROM printer_job_history
-            WHERE id = %s;
+            UPDATE printer_job_history
+            SET end_time = $1, status = $2
+            WHERE id = $3 AND end_time IS NULL
+            RETURNING filename
             """,
-            (manager.current_job_id,),
+            (end_time, status, manager.current_job_id),
             fetch=True
         )
 
-        if job_info and len(job_info) > 0:
-            filename, existing_end_time = job_info[0]
-
-            # Only update if job hasn't already been ended
-            if existing_end_time is None:
-                self.db_manager.execute_query(
-                    """
-                    UPDATE printer_job_history
-                    SET end_time = %s, status = %s
-                    WHERE id = %s AND end_time IS NULL;
-                    """,
-                    (end_time, status, manager.current_job_id)
-                )
-                self.console.print(f"  [blue]Job END (by ID):[/] {filename} - {status} (ID: {manager.current_job_id})")
-                if status == "FINISH":
-                    self.console.print(f"  [green]Job completed successfully[/]")
-            else:
-                self.console.print(f"  [dim]Job {manager.current_job_id} already ended, skipping[/]")
+        if ended_job:
+            filename = ended_job[0][0]
+            self.console.print(f"  [blue]Job END (by ID):[/] {filename} - {status} (ID: {manager.current_job_id})")
+            if status == "FINISH":
+                self.console.print(f"  [green]Job completed successfully[/]")
+            self.filament_summary_stale = True
+        else:
+            self.console.print(f"  [dim]Job {manager.current_job_id} already ended, skipping[/]")
 
+        self.filaments_logged.discard(manager.current_job_id)
         manager.current_job_id = None
+        manager.last_usage_key = None
+
+    def _refresh_filament_summary(self):
+        """Queue a refresh of the job_filament_summary view on the background writer."""
+        if JOB_FILAMENT_SUMMARY:
+            self.db_writer.submit(self._write_filament_summary_refresh)
+
+    def _write_filament_summary_refresh(self):
+        try:
+            self.db_manager.execute_autocommit("REFRESH MATERIALIZED VIEW CONCURRENTLY job_filament_summary;")
+        except Exception as e:
+            logging.error(f"Failed to refresh job_filament_summary: {e}")
 
     def _close_orphaned_jobs(self, manager, status):
         """Close any orphaned (unfinished) jobs for this printer when printer is idle/finished."""
-        end_time = datetime.datetime.now()
+        end_time = self.cycle_now
 
-        # Find all unfinished jobs for this printer
+        # Close all unfinished jobs for this printer in a single statement
         orphaned_jobs = self.db_manager.execute_query(
             """
-            SELECT id, filename FROM printer_job_history
+            UPDATE printer_job_history
+            SET end_time = %s, status = %s
             WHERE printer_id = %s AND end_time IS NULL
-            ORDER BY start_time DESC;
+            RETURNING id, filename;
             """,
-            (manager.printer_id,),
+            (end_time, status, manager.printer_id),
             fetch=True
         )
 
-        if orphaned_jobs and len(orphaned_jobs) > 0:
-            for job_id, filename in orphaned_jobs:
-                self.db_manager.execute_query(
-                    """
-                    UPDATE printer_job_history
-                    SET end_time = %s, status = %s
-                    WHERE id = %s;
-                    """,
-                    (end_time, status, job_id)
-                )
-                self.console.print(f"  [yellow]Closed orphaned job:[/] {filename} - {status} (ID: {job_id})")
-                if status == "FINISH":
-                    self.console.print(f"  [green]Job completed successfully[/]")
+        for job_id, filename in orphaned_jobs or []:
+            self.console.print(f"  [yellow]Closed orphaned job:[/] {filename} - {status} (ID: {job_id})")
+            if status == "FINISH":
+                self.console.print(f"  [green]Job completed successfully[/]")
+            self.filaments_logged.discard(job_id)
+        if orphaned_jobs:
+            self.filament_summary_stale = True
     
     def shutdown(self):
         """Clean shutdown of all connections."""
-        self.running = False
+        self.stop_event.set()
         self.console.print("[cyan]Shutting down...[/]")
+        self.poll_executor.shutdown(wait=True)
+        self.db_writer.shutdown(wait=True)  # finish the last status batch before closing the pool
         
         for manager in self.printer_managers:
             manager.disconnect()
         
         self.db_manager.close()
+        self.filament_profile_cache.clear()
         self.console.print("[green]Shutdown complete.[/]")
+        QueuedConsole.flush()
 
 if __name__ == '__main__':
     monitor = SafePrinterMonitor()
@@ -7,8 +7,16 @@ filament information for database storage.
 
 import os
 import sys
+import argparse
+import codecs
+import csv
+import io
 import json
+import shelve
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import psycopg2
 from dotenv import load_dotenv
 from rich.console import Console
@@ -17,6 +25,11 @@ from rich.progress import Progress, TaskID
 import re
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson  # optional, faster parsing and serialization of the profile JSON
+except ImportError:
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
@@ -29,11 +42,105 @@ DB_PASSWORD = os.environ.get('DB_PASSWORD')
 
 console = Console()
 
+
+def json_loads(content: bytes) -> Any:
+    """Parse a JSON response body (orjson if installed; both raise json.JSONDecodeError)."""
+    if orjson:
+        # orjson rejects a UTF-8 BOM, which json.loads and response.json() accept
+        return orjson.loads(content[3:] if content.startswith(codecs.BOM_UTF8) else content)
+    return json.loads(content)
+
+
+def json_dumps(data: Any) -> str:
+    """Serialize data as compact JSON (no whitespace between tokens)."""
+    if orjson:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+
+
+DOWNLOAD_WORKERS = 16  # concurrent profile downloads
+# Downloaded profile files keyed by git blob SHA, so unchanged files are not downloaded again;
+# they are parsed again on every run so parser changes apply to cached files too
+CACHE_PATH = os.environ.get(
+    'BAMBU_FILAMENT_CACHE',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.bambu_filament_cache')
+)
+
+# Material keyword -> (nozzle_temp_min, nozzle_temp_max, bed_temp) defaults, matched in this order
+MATERIAL_DEFAULTS = {
+    'pla': (190, 230, 60),
+    'abs': (240, 270, 80),
+    'petg': (230, 260, 70),
+    'tpu': (200, 250, 50),
+}
+
+
+def extract_first_value(field_data):
+    """Extract first value from array or return the value directly."""
+    if isinstance(field_data, list) and len(field_data) > 0:
+        return field_data[0]
+    return field_data
+
+
+def safe_float(value, default=0.0):
+    """Safely convert value to float."""
+    try:
+        if isinstance(value, str):
+            return float(value)
+        elif isinstance(value, (int, float)):
+            return float(value)
+        return default
+    except (ValueError, TypeError):
+        return default
+
+
+def safe_int(value, default=0):
+    """Safely convert value to int."""
+    if type(value) is int:  # already an int (bool is converted below)
+        return value
+    try:
+        if isinstance(value, str):
+            return int(float(value))  # Handle "190.0" -> 190
+        elif isinstance(value, (int, float)):
+            return int(value)
+        return default
+    except (ValueError, TypeError):
+        return default
+
+
+def match_material(text: str) -> Optional[str]:
+    """Return the first MATERIAL_DEFAULTS keyword contained in text (lowercase), or None."""
+    return next((material for material in MATERIAL_DEFAULTS if material in text), None)
+
+
+# bambu_filament_profiles columns written by save_to_database, in parsed-dict key order
+PROFILE_COLUMNS = (
+    'filename', 'name', 'filament_id', 'type', 'inherits', 'from_source', 'vendor', 'cost', 'density',
+    'flow_ratio', 'material_type', 'nozzle_temp_min', 'nozzle_temp_max', 'bed_temp', 'bed_temp_initial',
+    'impact_strength_z', 'diameter', 'retraction_length', 'retraction_speed', 'print_speed',
+    'start_gcode', 'end_gcode', 'raw_json',
+)
+# Text columns whose empty strings must load as '' rather than NULL
+PROFILE_TEXT_COLUMNS = (
+    'filename', 'name', 'filament_id', 'type', 'inherits', 'from_source', 'vendor',
+    'material_type', 'start_gcode', 'end_gcode',
+)
+
+
 class BambuFilamentFetcher:
-    def __init__(self):
-        self.github_api_base = "https://api.github.com/repos/bambulab/BambuStudio/contents/resources/profiles/BBL/filament"
-        self.raw_base = "https://raw.githubusercontent.com/bambulab/BambuStudio/master/resources/profiles/BBL/filament"
+    def __init__(self, download_workers: int = DOWNLOAD_WORKERS):
+        self.github_api_base = "https://api.github.com/repos/bambulab/BambuStudio"
+        self.filament_path = "resources/profiles/BBL/filament"
+        self.download_workers = max(1, download_workers)
+        # Set by fetch_filament_list to the master commit the listing was taken from
+        self.raw_base = None
         self.session = requests.Session()
+        # Keep one pooled connection per download worker, retrying rate limits and server errors
+        adapter = HTTPAdapter(
+            pool_maxsize=self.download_workers,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount("https://", adapter)
         self.filaments = []
         
     def fetch_filament_list(self) -> List[Dict[str, Any]]:
@@ -41,70 +148,79 @@ class BambuFilamentFetcher:
         console.print("[bold blue]Fetching filament file list from GitHub...[/]")
         
         try:
-            response = self.session.get(self.github_api_base)
+            # Pin the listing and every download to the current master commit
+            response = self.session.get(
+                f"{self.github_api_base}/commits/master",
+                headers={'Accept': 'application/vnd.github.sha'}
+            )
+            response.raise_for_status()
+            commit_sha = response.text.strip()
+            self.raw_base = f"https://raw.githubusercontent.com/bambulab/BambuStudio/{commit_sha}/{self.filament_path}"
+            
+            # One tree request lists the whole directory; the contents API stops at 1000 entries
+            response = self.session.get(f"{self.github_api_base}/git/trees/{commit_sha}:{self.filament_path}")
             response.raise_for_status()
-            files = response.json()
+            tree = response.json()['tree']
             
             # Filter for *@base.json files
-            base_files = [f for f in files if f['name'].endswith('@base.json')]
-            console.print(f"Found [bold]{len(base_files)}[/] @base.json files")
+            base_files = [
+                {'name': entry['path'], 'sha': entry['sha']}
+                for entry in tree
+                if entry['type'] == 'blob' and entry['path'].endswith('@base.json')
+            ]
+            console.print(f"Found [bold]{len(base_files)}[/] @base.json files at commit {commit_sha[:7]}")
             
             return base_files
             
-        except requests.RequestException as e:
+        except (requests.RequestException, KeyError) as e:
             console.print(f"[red]Error fetching file list: {e}[/]")
             return []
     
-    def download_and_parse_filament(self, file_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Download and parse a single filament JSON file."""
+    def download_filament(self, file_info: Dict[str, Any]) -> Optional[bytes]:
+        """Download a single filament JSON file, None if the request failed."""
         filename = file_info['name']
         download_url = f"{self.raw_base}/{filename}"
         
         try:
             response = self.session.get(download_url)
             response.raise_for_status()
+            return response.content
             
-            # Parse JSON
-            filament_data = response.json()
+        except requests.RequestException as e:
+            console.print(f"[red]Error downloading {filename}: {e}[/]")
+            return None
+    
+    def parse_filament_file(self, content: bytes, filename: str) -> Optional[Dict[str, Any]]:
+        """Parse a downloaded filament JSON file."""
+        try:
+            # Parse JSON straight from the response bytes
+            filament_data = json_loads(content)
             
-            # Extract relevant information
-            parsed_filament = self.parse_filament_data(filament_data, filename)
-            return parsed_filament
+            # Extract relevant information; the downloaded text is kept as raw_json as-is
+            return self.parse_filament_data(
+                filament_data, filename, raw_json=content.decode('utf-8-sig')
+            )
             
-        except (requests.RequestException, json.JSONDecodeError) as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             console.print(f"[red]Error processing {filename}: {e}[/]")
             return None
     
-    def parse_filament_data(self, data: Dict[str, Any], filename: str) -> Dict[str, Any]:
-        """Parse filament JSON data into structured format."""
-        
-        def extract_first_value(field_data):
-            """Extract first value from array or return the value directly."""
-            if isinstance(field_data, list) and len(field_data) > 0:
-                return field_data[0]
-            return field_data
-        
-        def safe_float(value, default=0.0):
-            """Safely convert value to float."""
-            try:
-                if isinstance(value, str):
-                    return float(value)
-                elif isinstance(value, (int, float)):
-                    return float(value)
-                return default
-            except (ValueError, TypeError):
-                return default
-        
-        def safe_int(value, default=0):
-            """Safely convert value to int."""
-            try:
-                if isinstance(value, str):
-                    return int(float(value))  # Handle "190.0" -> 190
-                elif isinstance(value, (int, float)):
-                    return int(value)
-                return default
-            except (ValueError, TypeError):
-                return default
+    def download_and_parse_filament(self, file_info: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Download and parse a single filament JSON file."""
+        content = self.download_filament(file_info)
+        if content is None:
+            return None
+        return self.parse_filament_file(content, file_info['name'])
+    
+    def parse_filament_data(self, data: Dict[str, Any], filename: str,
+                            raw_json: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Parse filament JSON data into structured format.
+
+        raw_json is the document's original text, if available; otherwise data is serialized.
+        Returns None for profiles without a filament_id, which cannot be stored.
+        """
+        if not data.get('filament_id'):
+            return None
         
         # Extract basic information
         raw_name = data.get('name', '')
@@ -145,49 +261,19 @@ class BambuFilamentFetcher:
             'start_gcode': extract_first_value(data.get('filament_start_gcode', [''])),
             'end_gcode': extract_first_value(data.get('filament_end_gcode', [''])),
             
-            # Raw JSON for reference
-            'raw_json': json.dumps(data, indent=2)
+            # Raw JSON for reference; compact when re-serialized, since JSONB discards the formatting anyway
+            'raw_json': raw_json if raw_json is not None else json_dumps(data)
         }
         
-        # Try to extract material type from inherits or name
-        if not parsed['nozzle_temp_min'] or not parsed['nozzle_temp_max']:
-            # Try to infer from inherits field
-            inherits = parsed['inherits'].lower()
-            if 'pla' in inherits:
-                parsed['material_type'] = 'PLA'
-                if not parsed['nozzle_temp_min']: parsed['nozzle_temp_min'] = 190
-                if not parsed['nozzle_temp_max']: parsed['nozzle_temp_max'] = 230
-                if not parsed['bed_temp']: parsed['bed_temp'] = 60
-            elif 'abs' in inherits:
-                parsed['material_type'] = 'ABS'
-                if not parsed['nozzle_temp_min']: parsed['nozzle_temp_min'] = 240
-                if not parsed['nozzle_temp_max']: parsed['nozzle_temp_max'] = 270
-                if not parsed['bed_temp']: parsed['bed_temp'] = 80
-            elif 'petg' in inherits:
-                parsed['material_type'] = 'PETG'
-                if not parsed['nozzle_temp_min']: parsed['nozzle_temp_min'] = 230
-                if not parsed['nozzle_temp_max']: parsed['nozzle_temp_max'] = 260
-                if not parsed['bed_temp']: parsed['bed_temp'] = 70
-            elif 'tpu' in inherits:
-                parsed['material_type'] = 'TPU'
-                if not parsed['nozzle_temp_min']: parsed['nozzle_temp_min'] = 200
-                if not parsed['nozzle_temp_max']: parsed['nozzle_temp_max'] = 250
-                if not parsed['bed_temp']: parsed['bed_temp'] = 50
-            else:
-                parsed['material_type'] = 'UNKNOWN'
-        else:
-            # Try to determine from name or filament_id
-            name_lower = parsed['name'].lower()
-            if 'pla' in name_lower:
-                parsed['material_type'] = 'PLA'
-            elif 'abs' in name_lower:
-                parsed['material_type'] = 'ABS'
-            elif 'petg' in name_lower:
-                parsed['material_type'] = 'PETG'
-            elif 'tpu' in name_lower:
-                parsed['material_type'] = 'TPU'
-            else:
-                parsed['material_type'] = 'UNKNOWN'
+        # Classify from inherits, falling back to the name, and fill any missing
+        # temperatures with the material's defaults
+        material = match_material(parsed['inherits'].lower()) or match_material(parsed['name'].lower())
+        if material:
+            temp_min, temp_max, bed_temp = MATERIAL_DEFAULTS[material]
+            parsed['nozzle_temp_min'] = parsed['nozzle_temp_min'] or temp_min
+            parsed['nozzle_temp_max'] = parsed['nozzle_temp_max'] or temp_max
+            parsed['bed_temp'] = parsed['bed_temp'] or bed_temp
+        parsed['material_type'] = material.upper() if material else 'UNKNOWN'
         
         return parsed
     
@@ -197,16 +283,45 @@ class BambuFilamentFetcher:
         if not files:
             return []
         
-        console.print(f"[bold blue]Downloading and parsing {len(files)} filament files...[/]")
-        
-        with Progress() as progress:
-            task = progress.add_task("Processing files...", total=len(files))
+        with shelve.open(CACHE_PATH) as cache:
+            # Files whose blob is unchanged since an earlier run are reused from the cache;
+            # anything else stored under the key (an older cache format) is downloaded again
+            keys = [f"{file_info['sha']}:{file_info['name']}" for file_info in files]
+            contents = [cache.get(key) for key in keys]
+            missing = [i for i, content in enumerate(contents) if not isinstance(content, bytes)]
+            console.print(f"[bold blue]Downloading {len(missing)} filament files "
+                          f"({len(files) - len(missing)} unchanged)...[/]")
+            
+            # Downloads run concurrently; results are kept in file order
+            with Progress() as progress, ThreadPoolExecutor(max_workers=self.download_workers) as executor:
+                task = progress.add_task("Downloading files...", total=len(missing))
+                futures = {
+                    executor.submit(self.download_filament, files[i]): i
+                    for i in missing
+                }
+                # Move the bar in about 100 steps rather than once per file
+                step = max(1, len(missing) // 100)
+                for done, future in enumerate(as_completed(futures), 1):
+                    contents[futures[future]] = future.result()
+                    if done % step == 0:
+                        progress.update(task, completed=done)
+                progress.update(task, completed=len(missing))
             
-            for file_info in files:
-                filament_data = self.download_and_parse_filament(file_info)
-                if filament_data:
-                    self.filaments.append(filament_data)
-                progress.advance(task)
+            # Only the main thread touches the shelf. Every downloaded file is kept,
+            # including ones the parser skips, so they are not fetched again next run
+            for i in missing:
+                if contents[i] is not None:
+                    cache[keys[i]] = contents[i]
+            # Drop blobs that are no longer in the listing so the shelf doesn't grow forever
+            current = set(keys)
+            for key in [key for key in cache.keys() if key not in current]:
+                del cache[key]
+        
+        results = (
+            self.parse_filament_file(content, file_info['name'])
+            for file_info, content in zip(files, contents) if content is not None
+        )
+        self.filaments.extend(filament_data for filament_data in results if filament_data)
         
         console.print(f"[green]Successfully parsed {len(self.filaments)} filament profiles[/]")
         return self.filaments
@@ -268,16 +383,34 @@ class BambuFilamentFetcher:
             # Note: Table should be created manually using create_bambu_filament_table.sql
             console.print("[blue]Assuming bambu_filament_profiles table exists...[/]")
             
-            # Insert or update filament data
-            insert_sql = """
-            INSERT INTO bambu_filament_profiles (
-                filename, name, filament_id, type, inherits, from_source, vendor, cost, density, 
-                flow_ratio, material_type, nozzle_temp_min, nozzle_temp_max, bed_temp, bed_temp_initial,
-                impact_strength_z, diameter, retraction_length, retraction_speed, print_speed,
-                start_gcode, end_gcode, raw_json
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            ) ON CONFLICT (filament_id) DO UPDATE SET
+            columns = ", ".join(PROFILE_COLUMNS)
+            
+            # One row per filament_id: an upsert may not touch the same row twice,
+            # so later files win just as they did with one INSERT per file
+            rows = {filament['filament_id']: [filament[c] for c in PROFILE_COLUMNS] for filament in self.filaments}
+            
+            # Stream all rows as CSV into a staging table with COPY
+            buf = io.StringIO()
+            csv.writer(buf).writerows(rows.values())
+            buf.seek(0)
+            console.print(f"[blue]Saving {len(rows)} filament profiles...[/]")
+            # The profiles can always be fetched again, so don't wait for the WAL flush on commit
+            cursor.execute("SET LOCAL synchronous_commit TO OFF")
+            cursor.execute(f"""
+                CREATE TEMP TABLE stg_filaments ON COMMIT DROP AS
+                SELECT {columns} FROM bambu_filament_profiles WITH NO DATA;
+            """)
+            cursor.copy_expert(
+                f"COPY stg_filaments ({columns}) FROM STDIN "
+                f"WITH (FORMAT csv, FORCE_NOT_NULL ({', '.join(PROFILE_TEXT_COLUMNS)}))",
+                buf
+            )
+            
+            # Upsert the staged rows in one statement
+            cursor.execute(f"""
+            INSERT INTO bambu_filament_profiles ({columns})
+            SELECT {columns} FROM stg_filaments
+            ON CONFLICT (filament_id) DO UPDATE SET
                 filename = EXCLUDED.filename,
                 name = EXCLUDED.name,
                 type = EXCLUDED.type,
@@ -301,29 +434,10 @@ class BambuFilamentFetcher:
                 end_gcode = EXCLUDED.end_gcode,
                 raw_json = EXCLUDED.raw_json,
                 updated_at = CURRENT_TIMESTAMP;
-            """
-            
-            # Insert data with progress bar
-            with Progress() as progress:
-                task = progress.add_task("Saving to database...", total=len(self.filaments))
-                
-                for filament in self.filaments:
-                    cursor.execute(insert_sql, (
-                        filament['filename'], filament['name'], filament['filament_id'],
-                        filament['type'], filament['inherits'], filament['from_source'],
-                        filament['vendor'], filament['cost'], filament['density'],
-                        filament['flow_ratio'], filament['material_type'],
-                        filament['nozzle_temp_min'], filament['nozzle_temp_max'],
-                        filament['bed_temp'], filament['bed_temp_initial'],
-                        filament['impact_strength_z'], filament['diameter'],
-                        filament['retraction_length'], filament['retraction_speed'],
-                        filament['print_speed'], filament['start_gcode'],
-                        filament['end_gcode'], filament['raw_json']
-                    ))
-                    progress.advance(task)
+            """)
             
             conn.commit()
-            console.print(f"[green]Successfully saved {len(self.filaments)} filament profiles to database[/]")
+            console.print(f"[green]Successfully saved {len(rows)} filament profiles to database[/]")
             
         except psycopg2.Error as e:
             console.print(f"[red]Database error: {e}[/]")
@@ -348,11 +462,44 @@ class BambuFilamentFetcher:
         except Exception as e:
             console.print(f"[red]Error saving to JSON: {e}[/]")
 
-def main():
+
+SAVE_TARGETS = ['db', 'json', 'both', 'none']
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Command-line options shared by this script and run_bambu_fetcher.py."""
+    parser = argparse.ArgumentParser(description="Fetch Bambu Lab filament profiles from the BambuStudio GitHub repository.")
+    parser.add_argument('--save', choices=SAVE_TARGETS,
+                        help="where to save the fetched profiles (asks interactively when omitted)")
+    parser.add_argument('--output', default="bambu_filaments.json", metavar='PATH',
+                        help="JSON file written by --save json/both (default: %(default)s)")
+    parser.add_argument('--concurrency', type=int, default=DOWNLOAD_WORKERS, metavar='N',
+                        help="number of concurrent profile downloads (default: %(default)s)")
+    return parser
+
+
+def ask_save_target() -> str:
+    """Interactive fallback for when --save is not given."""
+    console.print("\n[bold]What would you like to do with the fetched data?[/]")
+    console.print("1. Save to database")
+    console.print("2. Save to JSON file")
+    console.print("3. Both")
+    console.print("4. Exit without saving")
+
+    while True:
+        choice = input("\nEnter your choice (1-4): ").strip()
+        if choice in ['1', '2', '3', '4']:
+            return SAVE_TARGETS[int(choice) - 1]
+        console.print("[red]Invalid choice. Please enter 1, 2, 3, or 4.[/]")
+
+
+def main(argv: Optional[List[str]] = None):
+    args = build_arg_parser().parse_args(argv)
+
     console.print("[bold cyan]Bambu Lab Filament Profile Fetcher[/]")
     console.print("This script fetches filament profiles from the BambuStudio GitHub repository\n")
     
-    fetcher = BambuFilamentFetcher()
+    fetcher = BambuFilamentFetcher(download_workers=args.concurrency)
     
     # Fetch all filaments
     filaments = fetcher.fetch_all_filaments()
@@ -364,20 +511,13 @@ def main():
     # Display summary
     fetcher.display_summary()
     
-    # Ask user what to do with the data
-    console.print("\n[bold]What would you like to do with the fetched data?[/]")
-    console.print("1. Save to database")
-    console.print("2. Save to JSON file")
-    console.print("3. Both")
-    console.print("4. Exit without saving")
-    
-    choice = input("\nEnter your choice (1-4): ").strip()
+    target = args.save or ask_save_target()
     
-    if choice in ['1', '3']:
+    if target in ['db', 'both']:
         fetcher.save_to_database()
     
-    if choice in ['2', '3']:
-        fetcher.save_to_json()
+    if target in ['json', 'both']:
+        fetcher.save_to_json(args.output)
     
     console.print("\n[green]Done![/]")
 
@@ -10,10 +10,15 @@ import os
 # Add the parent directory to the path so we can import the fetcher
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from scripts.fetch_bambu_filaments import BambuFilamentFetcher
+from scripts.fetch_bambu_filaments import BambuFilamentFetcher, build_arg_parser, ask_save_target
 from rich.console import Console
 
-def main():
+def main(argv=None):
+    parser = build_arg_parser()
+    parser.add_argument('--yes', '-y', action='store_true',
+                        help="skip the confirmation prompt")
+    args = parser.parse_args(argv)
+
     console = Console()
     
     console.print("[bold cyan]Bambu Lab Filament Profile Fetcher[/]")
@@ -25,12 +30,13 @@ def main():
     console.print("3. Installed required dependencies: pip install requests psycopg2 rich python-dotenv\n")
     
     # Ask user if they want to continue
-    response = input("Do you want to continue? (y/N): ").strip().lower()
-    if response not in ['y', 'yes']:
-        console.print("[yellow]Exiting...[/]")
-        return
+    if not args.yes:
+        response = input("Do you want to continue? (y/N): ").strip().lower()
+        if response not in ['y', 'yes']:
+            console.print("[yellow]Exiting...[/]")
+            return
     
-    fetcher = BambuFilamentFetcher()
+    fetcher = BambuFilamentFetcher(download_workers=args.concurrency)
     
     # Fetch all filaments
     console.print("\n[bold blue]Step 1: Fetching filament data from GitHub...[/]")
@@ -44,28 +50,17 @@ def main():
     console.print("\n[bold blue]Step 2: Displaying summary...[/]")
     fetcher.display_summary()
     
-    # Ask user what to do with the data
-    console.print("\n[bold]What would you like to do with the fetched data?[/]")
-    console.print("1. Save to database")
-    console.print("2. Save to JSON file")
-    console.print("3. Both")
-    console.print("4. Exit without saving")
-    
-    while True:
-        choice = input("\nEnter your choice (1-4): ").strip()
-        if choice in ['1', '2', '3', '4']:
-            break
-        console.print("[red]Invalid choice. Please enter 1, 2, 3, or 4.[/]")
+    target = args.save or ask_save_target()
     
-    if choice in ['1', '3']:
+    if target in ['db', 'both']:
         console.print("\n[bold blue]Step 3: Saving to database...[/]")
         fetcher.save_to_database()
     
-    if choice in ['2', '3']:
+    if target in ['json', 'both']:
         console.print("\n[bold blue]Step 3: Saving to JSON file...[/]")
-        fetcher.save_to_json()
+        fetcher.save_to_json(args.output)
     
-    if choice == '4':
+    if target == 'none':
         console.print("[yellow]Exiting without saving.[/]")
     
     console.print("\n[green]Done![/]")
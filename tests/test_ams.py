@@ -0,0 +1,21 @@
+"""
+Test the AMS hub
+"""
+
+import pytest  # noqa: F401, F403
+
+from bambulabs_api.ams import AMS, AMSHub
+
+
+def test_ams_hub_items():
+    hub = AMSHub()
+    hub.parse_list([
+        {"id": "0", "humidity": "4", "temperature": "25.0", "tray": []},
+        {"id": "1", "humidity": "3", "temperature": "24.5", "tray": []},
+    ])
+    assert [ams_id for ams_id, _ in hub.items()] == [0, 1]
+    assert all(isinstance(ams, AMS) for _, ams in hub.items())
+
+
+def test_ams_hub_items_empty():
+    assert list(AMSHub().items()) == []
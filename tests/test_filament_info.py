@@ -0,0 +1,22 @@
+"""
+Test the Filament enum
+"""
+
+import pytest  # noqa: F401, F403
+
+from bambulabs_api.filament_info import AMSFilamentSettings, Filament
+
+
+def test_filament_from_name():
+    assert Filament("BAMBU_PLA_BASIC") == Filament.BAMBU_PLA_BASIC
+    assert Filament("PLA") == Filament.PLA
+
+
+def test_filament_from_settings():
+    settings = AMSFilamentSettings("GFB00", 240, 270, "ABS")
+    assert Filament(settings) == Filament.BAMBU_ABS
+
+
+def test_filament_unknown():
+    with pytest.raises(ValueError):
+        Filament("NOT_A_FILAMENT")
@@ -64,3 +64,22 @@ def test_nozzle_diameter():
 def test_get_firmware():
     assert mqtt.firmware_version() == "01.07.00.00"
     assert mqtt.printer_info.firmware_version == "01.07.00.00"
+
+
+def test_print_snapshot():
+    snapshot = mqtt.print_snapshot()
+    assert snapshot["gcode_state"] == "FINISH"
+    assert snapshot["nozzle_diameter"] == "0.4"
+
+    snapshot["gcode_state"] = "FAILED"
+    assert mqtt.get_printer_state() == GcodeState.FINISH
+
+
+def test_wait_until_ready():
+    assert mqtt.wait_until_ready(timeout=0)
+
+    mqtt_ = bl.PrinterMQTTClient(hostname="", access="", printer_serial="")
+    assert not mqtt_.wait_until_ready(timeout=0)
+
+    mqtt_.manual_update({"print": {"gcode_state": "IDLE"}})
+    assert mqtt_.wait_until_ready(timeout=0)